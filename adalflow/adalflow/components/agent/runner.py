@@ -1,12 +1,16 @@
 """Agent runner component for managing and executing agent workflows."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 import logging
 import inspect
 import asyncio
 import uuid
 import json
+import threading
+from concurrent.futures import Future
 from datetime import datetime
+from functools import lru_cache
+from types import AsyncGeneratorType, CoroutineType, GeneratorType
 
 from typing import (
     Any,
@@ -17,16 +21,20 @@ from typing import (
     Type,
     TypeVar,
     Union,
-    AsyncIterable,
 )
 from typing_extensions import TypeAlias
 import sys
 
 
 from adalflow.optim.parameter import Parameter
-from adalflow.utils import printc
 from adalflow.core.component import Component
 from adalflow.components.agent.agent import Agent
+from adalflow.core.func_tool import (
+    _background_runtime,
+    _ensure_nest_asyncio,
+    install_uvloop,
+    is_running_in_event_loop,
+)
 
 from adalflow.core.types import (
     GeneratorOutput,
@@ -51,6 +59,7 @@ from adalflow.apps.permission_manager import PermissionManager
 from adalflow.components.memory.memory import ConversationMemory
 from adalflow.core.functional import _is_pydantic_dataclass, _is_adalflow_dataclass
 from adalflow.tracing import (
+    NoOpSpan,
     runner_span,
     tool_span,
     response_span,
@@ -95,6 +104,80 @@ def _is_unrecoverable_error(error: Optional[str]) -> bool:  # pragma: no cover
     
     return False
 
+def _default_runner_id(prefix: str, prompt_kwargs: Optional[Dict[str, Any]]) -> str:
+    """Runner id used for tracing when the caller does not pass one.
+
+    Hashes only the user query instead of ``str(prompt_kwargs)``, which formats every prompt
+    argument (retrieved context, chat history, ...) on each run.
+    """
+    key = prompt_kwargs.get("input_str") if prompt_kwargs else None
+    if not isinstance(key, str):
+        key = id(prompt_kwargs)
+    return f"{prefix}_{hash(key)}"
+
+
+@lru_cache(maxsize=128)
+def _answer_kind(answer_data_type: Any) -> Literal["pydantic", "adalflow", "builtin"]:
+    """How the final answer is converted to ``answer_data_type``, resolved once per type."""
+    if _is_pydantic_dataclass(answer_data_type):
+        return "pydantic"
+    if _is_adalflow_dataclass(answer_data_type):
+        return "adalflow"
+    return "builtin"
+
+
+def _has_deferred_validator(answer_data_type: Any) -> bool:
+    """Whether a pydantic answer type (``defer_build=True``) builds its validator on first use."""
+    return _answer_kind(answer_data_type) == "pydantic" and not getattr(
+        answer_data_type, "__pydantic_complete__", True
+    )
+
+
+# one background validator build per deferred answer type, shared by the concurrent runs using it:
+# answer type -> [build future, number of runs holding it]
+_VALIDATOR_BUILDS: Dict[Any, List[Any]] = {}
+_VALIDATOR_BUILDS_LOCK = threading.Lock()
+
+
+def _acquire_validator_build(answer_data_type: Any) -> Optional[Future]:
+    """Start, or join the pending, background ``model_rebuild`` of a deferred pydantic answer type."""
+    if not _has_deferred_validator(answer_data_type):
+        return None
+    with _VALIDATOR_BUILDS_LOCK:
+        entry = _VALIDATOR_BUILDS.get(answer_data_type)
+        if entry is None:
+            build = _background_runtime.submit_blocking(
+                answer_data_type.model_rebuild, raise_errors=False
+            )
+            entry = _VALIDATOR_BUILDS[answer_data_type] = [build, 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_validator_build(answer_data_type: Any, build: Future) -> None:
+    """Drop a run's hold on the build, cancelling it if no run holds it and it has not started yet."""
+    with _VALIDATOR_BUILDS_LOCK:
+        entry = _VALIDATOR_BUILDS.get(answer_data_type)
+        if entry is None or entry[0] is not build:
+            return
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _VALIDATOR_BUILDS[answer_data_type]
+            build.cancel()  # no-op once the build runs or is done
+
+
+# JSON answers (pydantic/adalflow answer types) longer than this are parsed off the event loop,
+# below it the thread hop costs more than the validation itself.
+_PROCESS_DATA_IN_THREAD_MIN_SIZE = 2048
+
+
+def _observation_of(function_output: Any) -> Any:
+    """What the planner sees of a tool output: ``ToolOutput.observation``, otherwise the output itself."""
+    if isinstance(function_output, ToolOutput):
+        return function_output.observation
+    return function_output
+
+
 BuiltInType: TypeAlias = Union[str, int, float, bool, list, dict, tuple, set, None]
 PydanticDataClass: TypeAlias = Type[BaseModel]
 AdalflowDataClass: TypeAlias = Type[
@@ -140,6 +223,7 @@ class Runner(Component):
         max_steps: Optional[int] = None, # this will overwrite the agent's max_steps
         permission_manager: Optional[PermissionManager] = None,
         conversation_memory: Optional[ConversationMemory] = None,
+        use_uvloop: bool = False,
         **kwargs,
     ) -> None:
         """Initialize runner with an agent and configuration.
@@ -151,8 +235,16 @@ class Runner(Component):
             max_steps: Maximum number of steps to execute
             permission_manager: Optional permission manager for tool approval
             conversation_memory: Optional conversation memory
+            use_uvloop: Install uvloop as the event loop policy (once per process) to cut the
+                per-await scheduling overhead of acall/astream. Loops created afterwards are uvloop
+                loops; profilers that hook the default loop lose some fidelity under it.
+                uvloop cannot run once nest_asyncio is applied, which happens the first time an async
+                tool is called synchronously from a running loop; after that, this logs a warning and
+                keeps the default loop.
         """
         super().__init__(**kwargs)
+        if use_uvloop:
+            install_uvloop()  # refuses with a warning once nest_asyncio is applied
         self.agent = agent
         self.tool_manager = agent.tool_manager
         self.permission_manager = permission_manager
@@ -314,12 +406,10 @@ class Runner(Component):
                 # Task didn't cancel in time or was cancelled - that's ok
                 pass
 
-    def _check_last_step(self, step: Function) -> bool:
+    @staticmethod
+    def _check_last_step(step: Function) -> bool:
         """Check if the last step has is_answer_final set to True."""
-        if hasattr(step, "_is_answer_final") and step._is_answer_final:
-            return True
-
-        return False
+        return bool(getattr(step, "_is_answer_final", False))
 
     def _get_final_answer(self, function: Function) -> Any:
         """Get and process the final answer from the function."""
@@ -327,12 +417,26 @@ class Runner(Component):
             return self._process_data(function._answer)
         return None
 
+    async def _aget_final_answer(self, function: Function) -> Any:
+        """Async :meth:`_get_final_answer`: large JSON answers are validated in a worker thread
+        so that the event loop keeps serving other runners in the meantime."""
+        if not hasattr(function, "_answer"):
+            return None
+        answer = function._answer
+        if (
+            isinstance(answer, (str, bytes))
+            and len(answer) > _PROCESS_DATA_IN_THREAD_MIN_SIZE
+            and _answer_kind(self.answer_data_type) != "builtin"
+        ):
+            return await asyncio.to_thread(self._process_data, answer)
+        return self._process_data(answer)
+
 
     def _create_runner_result(self, answer: Any, step_history, error: Optional[str] = None,  ) -> RunnerResult:
         """Create a RunnerResult object with the final answer and error."""
         return RunnerResult(
             answer=answer,
-            step_history=step_history.copy(),
+            step_history=step_history,
             error=error,
             # ctx=self.ctx,
         )
@@ -348,7 +452,7 @@ class Runner(Component):
 
         # set up the final answer
         streaming_result.answer = runner_result.answer if runner_result else None
-        streaming_result.step_history = self.step_history.copy()
+        streaming_result.step_history = self.step_history
         streaming_result._is_complete = True
 
     def _add_assistant_response_to_memory(self, final_output_item: FinalOutputItem):
@@ -358,12 +462,15 @@ class Runner(Component):
                 AssistantResponse(
                     response_str=final_output_item.data.answer,
                     metadata={
-                        "step_history": final_output_item.data.step_history.copy()
+                        "step_history": final_output_item.data.step_history
                     },
                 )
             )
 
     def create_response_span(self, runner_result, step_count: int, streaming_result: RunnerStreamingResult, runner_span_instance, workflow_status: str = "stream_completed"):
+        # a span nested in a no-op runner span is a no-op as well, skip building its metadata
+        if isinstance(runner_span_instance, NoOpSpan):
+            return
 
         runner_span_instance.span_data.update_attributes(
             {
@@ -444,29 +551,36 @@ class Runner(Component):
 
         try:
             model_output = None
-            log.info(f"answer_data_type: {type(self.answer_data_type)}")
+            log.info("answer_data_type: %s", type(self.answer_data_type))
 
             # returns a dictionary in this case
-            if _is_pydantic_dataclass(self.answer_data_type):
+            answer_kind = _answer_kind(self.answer_data_type)
+            if answer_kind == "pydantic":
                 log.info(
-                    f"initial answer returned by finish when user passed a pydantic type: {data}, type: {type(data)}"
+                    "initial answer returned by finish when user passed a pydantic type: %s, type: %s",
+                    data,
+                    type(data),
                 )
-                # if it has not yet been deserialized then deserialize into dictionary using json loads
-                if isinstance(data, str):
+                # if it has not yet been deserialized, parse and validate the json string in one pass
+                if isinstance(data, (str, bytes)):
                     try:
-                        data = json.loads(data)
-                    except json.JSONDecodeError as e:
-                        raise ValueError(f"Invalid JSON in data: {e}")
-                    if not isinstance(data, dict):
-                        raise ValueError(f"Expected dict after JSON parsing, got {type(data)}")
-                log.info(
-                    f"initial answer after being evaluated using json: {data}, type: {type(data)}"
-                )
-                # data should be a string that represents a dictionary
-                model_output = self.answer_data_type(**data)
-            elif _is_adalflow_dataclass(self.answer_data_type):
+                        model_output = self.answer_data_type.model_validate_json(data)
+                    except ValidationError as e:
+                        error = e.errors(include_url=False)[0]
+                        if error["type"] == "json_invalid":
+                            raise ValueError(f"Invalid JSON in data: {error['msg']}")
+                        if error["type"] == "model_type":
+                            raise ValueError(
+                                f"Expected dict after JSON parsing, got {type(error['input'])}"
+                            )
+                        raise
+                else:
+                    model_output = self.answer_data_type(**data)
+            elif answer_kind == "adalflow":
                 log.info(
-                    f"initial answer returned by finish when user passed a adalflow type: {data}, type: {type(data)}"
+                    "initial answer returned by finish when user passed a adalflow type: %s, type: %s",
+                    data,
+                    type(data),
                 )
 
                 if isinstance(data, str):
@@ -477,13 +591,17 @@ class Runner(Component):
                     if not isinstance(data, dict):
                         raise ValueError(f"Expected dict after JSON parsing, got {type(data)}")
                 log.info(
-                    f"initial answer after being evaluated using json: {data}, type: {type(data)}"
+                    "initial answer after being evaluated using json: %s, type: %s",
+                    data,
+                    type(data),
                 )
                 # data should be a string that represents a dictionary
                 model_output = self.answer_data_type.from_dict(data)
             else:  # expect data to be a python built_in_type
                 log.info(
-                    f"type of answer is neither a pydantic dataclass or adalflow dataclass, answer before being casted again for safety: {data}, type: {type(data)}"
+                    "type of answer is neither a pydantic dataclass or adalflow dataclass, answer before being casted again for safety: %s, type: %s",
+                    data,
+                    type(data),
                 )
                 data = self.answer_data_type(
                     data
@@ -526,6 +644,80 @@ class Runner(Component):
 
         return function
 
+    def _start_run(self, prompt_kwargs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Reset the step history, record the user query and build the planner prompt kwargs of a new run."""
+        self.step_history = []
+
+        # take in the query in prompt_kwargs
+        prompt_kwargs = prompt_kwargs.copy() if prompt_kwargs else {}
+        prompt_kwargs["step_history"] = (
+            self.step_history
+        )  # a reference to the step history
+
+        if self.use_conversation_memory:
+            # Reset any pending query state before starting a new query
+            self.conversation_memory.reset_pending_query()
+
+            prompt_kwargs["chat_history_str"] = self.conversation_memory()
+            # save the user query to the conversation memory
+
+            # meta data is all keys in the list of context_str
+            query_metadata = {"context_str": prompt_kwargs.get("context_str", None)}
+            self.conversation_memory.add_user_query(
+                UserQuery(
+                    query_str=prompt_kwargs.get("input_str", None),
+                    metadata=query_metadata,
+                )
+            )
+
+        # set maximum number of steps for the planner into the prompt
+        prompt_kwargs["max_steps"] = self.max_steps
+        return prompt_kwargs
+
+    def _complete_run(
+        self,
+        runner_span_instance,
+        step_count: int,
+        last_output: Optional[RunnerResult],
+        current_error: Optional[str],
+    ) -> RunnerResult:
+        """Trace the end of a call/acall run and return its result."""
+        # Update runner span with completion info using update_attributes
+        runner_span_instance.span_data.update_attributes(
+            {
+                "steps_executed": step_count,
+                "final_answer": last_output.answer if last_output else None,
+                "workflow_status": "completed",
+            }
+        )
+
+        # Create response span for tracking final result
+        with response_span(
+            answer=(
+                last_output.answer
+                if last_output
+                else f"No output generated after {step_count} steps (max_steps: {self.max_steps})"
+            ),
+            result_type=(
+                type(last_output.answer).__name__ if last_output else "no_output"
+            ),
+            execution_metadata={
+                "steps_executed": step_count,
+                "max_steps": self.max_steps,
+                "workflow_status": "completed" if last_output else "incomplete",
+            },
+            response=last_output,  # can be None if Runner has not finished in the max steps
+        ):
+            pass
+
+        # Always return a RunnerResult, even if no successful completion
+        # the run is over and the next one rebinds self.step_history, so no copy is needed
+        return last_output or RunnerResult(
+            answer=current_error or f"No output generated after {step_count} steps (max_steps: {self.max_steps})",
+            step_history=self.step_history,
+            error=current_error,
+        )
+
     def call(
         self,
         prompt_kwargs: Dict[str, Any],
@@ -546,41 +738,20 @@ class Runner(Component):
         Returns:
             RunnerResult containing step history and final processed output
         """
+        if is_running_in_event_loop():
+            # the asyncio.run calls for coroutine tool outputs and permission checks re-enter the loop
+            _ensure_nest_asyncio()
         # Create runner span for tracing
         with runner_span(
-            runner_id=id or f"runner_{hash(str(prompt_kwargs))}",
+            runner_id=id or _default_runner_id("runner", prompt_kwargs),
             max_steps=self.max_steps,
             workflow_status="starting",
         ) as runner_span_instance:
             # reset the step history
-            self.step_history = []
-
-            # take in the query in prompt_kwargs
-            prompt_kwargs = prompt_kwargs.copy() if prompt_kwargs else {}
-            prompt_kwargs["step_history"] = (
-                self.step_history
-            )  # a reference to the step history
-
-            if self.use_conversation_memory:
-                # Reset any pending query state before starting a new query
-                self.conversation_memory.reset_pending_query()
-
-                prompt_kwargs["chat_history_str"] = self.conversation_memory()
-                # save the user query to the conversation memory
-
-                # meta data is all keys in the list of context_str
-                query_metadata = {"context_str": prompt_kwargs.get("context_str", None)}
-                self.conversation_memory.add_user_query(
-                    UserQuery(
-                        query_str=prompt_kwargs.get("input_str", None),
-                        metadata=query_metadata,
-                    )
-                )
-
-            # set maximum number of steps for the planner into the prompt
-            prompt_kwargs["max_steps"] = self.max_steps
+            prompt_kwargs = self._start_run(prompt_kwargs)
 
-            model_kwargs = model_kwargs.copy() if model_kwargs else {}
+            # never mutated here: the planner composes its own dict from it
+            model_kwargs = model_kwargs or {}
 
             step_count = 0
             last_output = None
@@ -588,7 +759,12 @@ class Runner(Component):
 
             while step_count < self.max_steps:
                 try:
-                    log.debug(f"Running step {step_count + 1}/{self.max_steps} with prompt_kwargs: {prompt_kwargs}")
+                    log.debug(
+                        "Running step %s/%s with prompt_kwargs: %s",
+                        step_count + 1,
+                        self.max_steps,
+                        prompt_kwargs,
+                    )
                     # Create step span for each iteration
                     with step_span(
                         step_number=step_count, action_type="planning"
@@ -605,9 +781,14 @@ class Runner(Component):
                         # Track token usage
                         step_tokens = self._update_token_consumption()
                         if step_tokens > 0:
-                            log.debug(f"Step {step_count} - Prompt tokens: {step_tokens}, Total: {self._token_consumption['total_prompt_tokens']}")
+                            log.debug(
+                                "Step %s - Prompt tokens: %s, Total: %s",
+                                step_count,
+                                step_tokens,
+                                self._token_consumption["total_prompt_tokens"],
+                            )
 
-                        log.debug(f"planner output: {output}")
+                        log.debug("planner output: %s", output)
 
                         # consistency with impl_astream, break if output is not a Generator Output 
                         if not isinstance(output, GeneratorOutput):
@@ -627,7 +808,7 @@ class Runner(Component):
 
                         function = output.data
 
-                        log.debug(f"function: {function}")
+                        log.debug("function: %s", function)
                         if function is None:
                             error_msg = f"Run into error: {output.error}, raw response: {output.raw_response}"
                             # Handle recoverable vs unrecoverable errors
@@ -662,12 +843,14 @@ class Runner(Component):
                             function.thought = thinking
                             
 
-                        if self._check_last_step(function):
+                        is_final = self._check_last_step(function)
+                        if is_final:
                             processed_data = self._process_data(function._answer)
                             # Wrap final output in RunnerResult
+                            # the run ends here, share the history instead of copying it
                             last_output = RunnerResult(
                                 answer=processed_data,
-                                step_history=self.step_history.copy(),
+                                step_history=self.step_history,
                                 # ctx=self.ctx,
                             )
 
@@ -677,7 +860,7 @@ class Runner(Component):
                                     AssistantResponse(
                                         response_str=processed_data,
                                         metadata={
-                                            "step_history": self.step_history.copy()
+                                            "step_history": last_output.step_history
                                         },
                                     )
                                 )
@@ -734,11 +917,7 @@ class Runner(Component):
                         
                         # Use the processed output
                         function_output = real_function_output
-                        function_output_observation = function_output
-                        if isinstance(function_output, ToolOutput) and hasattr(
-                            function_output, "observation"
-                        ):
-                            function_output_observation = function_output.observation
+                        function_output_observation = _observation_of(function_output)
 
                         # create a step output
                         step_output = StepOutput(
@@ -753,16 +932,17 @@ class Runner(Component):
                             {
                                 "tool_name": function.name,
                                 "tool_output": function_results,
-                                "is_final": self._check_last_step(function),
+                                "is_final": is_final,
                                 "observation": function_output_observation,
                             }
                         )
 
-                        log.debug(
-                            "The prompt with the prompt template is {}".format(
-                                self.agent.planner.get_prompt(**prompt_kwargs)
+                        # rendering the prompt is O(history), only do it when it is logged
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug(
+                                "The prompt with the prompt template is %s",
+                                self.agent.planner.get_prompt(**prompt_kwargs),
                             )
-                        )
                         self.step_history.append(step_output)
                         step_count += 1
 
@@ -788,40 +968,8 @@ class Runner(Component):
                     current_error = error_msg
                     break
 
-            # Update runner span with final results
-            # Update runner span with completion info using update_attributes
-            runner_span_instance.span_data.update_attributes(
-                {
-                    "steps_executed": step_count,
-                    "final_answer": last_output.answer if last_output else None,
-                    "workflow_status": "completed",
-                }
-            )
-
-            # Create response span for tracking final result
-            with response_span(
-                answer=(
-                    last_output.answer
-                    if last_output
-                    else f"No output generated after {step_count} steps (max_steps: {self.max_steps})"
-                ),
-                result_type=(
-                    type(last_output.answer).__name__ if last_output else "no_output"
-                ),
-                execution_metadata={
-                    "steps_executed": step_count,
-                    "max_steps": self.max_steps,
-                    "workflow_status": "completed" if last_output else "incomplete",
-                },
-                response=last_output,  # can be None if Runner has not finished in the max steps
-            ):
-                pass
-
-            # Always return a RunnerResult, even if no successful completion
-            return last_output or RunnerResult(
-                answer=current_error or f"No output generated after {step_count} steps (max_steps: {self.max_steps})",
-                step_history=self.step_history.copy(),
-                error=current_error,
+            return self._complete_run(
+                runner_span_instance, step_count, last_output, current_error
             )
 
     def _tool_execute_sync(
@@ -863,7 +1011,8 @@ class Runner(Component):
 
         result = self.agent.tool_manager.execute_func(func=func)
 
-        if not isinstance(result, FunctionOutput):
+        # ToolManager.execute_func already guarantees a FunctionOutput, only re-check in debug runs
+        if __debug__ and not isinstance(result, FunctionOutput):
             raise ValueError("Result is not a FunctionOutput")
 
         # check error
@@ -897,7 +1046,7 @@ class Runner(Component):
 
 
         workflow_status = "starting"
-        runner_id = id or f"async_runner_{hash(str(prompt_kwargs))}"
+        runner_id = id or _default_runner_id("async_runner", prompt_kwargs)
 
         
 
@@ -910,296 +1059,255 @@ class Runner(Component):
             # Reset cancellation flag at start of new execution
             self.reset_cancellation()
 
-            self.step_history = []
-            prompt_kwargs = prompt_kwargs.copy() if prompt_kwargs else {}
-
-            prompt_kwargs["step_history"] = (
-                self.step_history
-            )  # a reference to the step history
-
-            if self.use_conversation_memory:
-                # Reset any pending query state before starting a new query
-                self.conversation_memory.reset_pending_query()
-
-                prompt_kwargs["chat_history_str"] = self.conversation_memory()
-                # save the user query to the conversation memory
-
-                # meta data is all keys in the list of context_str
-                query_metadata = {"context_str": prompt_kwargs.get("context_str", None)}
-                self.conversation_memory.add_user_query(
-                    UserQuery(
-                        query_str=prompt_kwargs.get("input_str", None),
-                        metadata=query_metadata,
-                    )
-                )
-
-            # set maximum number of steps for the planner into the prompt
-            prompt_kwargs["max_steps"] = self.max_steps
+            prompt_kwargs = self._start_run(prompt_kwargs)
 
-            model_kwargs = model_kwargs.copy() if model_kwargs else {}
-
-            step_count = 0
-            last_output = None
-            current_error = None
+            # never mutated here: the planner composes its own dict from it
+            model_kwargs = model_kwargs or {}
 
-            while step_count < self.max_steps and not self.is_cancelled():
-                try:
-                    log.debug(f"Running async step {step_count + 1}/{self.max_steps} with prompt_kwargs: {prompt_kwargs}")
+            # a deferred pydantic validator is otherwise built when validating the final answer,
+            # build it in a worker thread while the first planner call is in flight instead
+            answer_data_type = self.answer_data_type
+            validator_build = _acquire_validator_build(answer_data_type)
+            try:
+                step_count = 0
+                last_output = None
+                current_error = None
 
-                    # Create step span for each iteration
-                    with step_span(
-                        step_number=step_count, action_type="async_planning"
-                    ) as step_span_instance:
+                while step_count < self.max_steps and not self.is_cancelled():
+                    try:
+                        log.debug(
+                            "Running async step %s/%s with prompt_kwargs: %s",
+                            step_count + 1,
+                            self.max_steps,
+                            prompt_kwargs,
+                        )
 
-                        log.debug(f"Running async step {step_count + 1}/{self.max_steps} with prompt_kwargs: {prompt_kwargs}")
+                        # Create step span for each iteration
+                        with step_span(
+                            step_number=step_count, action_type="async_planning"
+                        ) as step_span_instance:
                         
-                        if self.is_cancelled():
-                            raise asyncio.CancelledError("Execution cancelled by user")
-
-                        # Call the planner first to get the output
-                        output: GeneratorOutput = await self.agent.planner.acall(
-                            prompt_kwargs=prompt_kwargs,
-                            model_kwargs=model_kwargs,
-                            use_cache=use_cache,
-                            id=id,
-                        )
+                            if self.is_cancelled():
+                                raise asyncio.CancelledError("Execution cancelled by user")
+
+                            # Call the planner first to get the output
+                            output: GeneratorOutput = await self.agent.planner.acall(
+                                prompt_kwargs=prompt_kwargs,
+                                model_kwargs=model_kwargs,
+                                use_cache=use_cache,
+                                id=id,
+                            )
                         
-                        # Track token usage
-                        step_tokens = self._update_token_consumption()
-                        if step_tokens > 0:
-                            log.debug(f"Step {step_count} - Prompt tokens: {step_tokens}, Total: {self._token_consumption['total_prompt_tokens']}")
+                            # Track token usage
+                            step_tokens = self._update_token_consumption()
+                            if step_tokens > 0:
+                                log.debug(
+                                    "Step %s - Prompt tokens: %s, Total: %s",
+                                    step_count,
+                                    step_tokens,
+                                    self._token_consumption["total_prompt_tokens"],
+                                )
 
-                        log.debug(f"planner output: {output}")
+                            log.debug("planner output: %s", output)
 
-                        if not isinstance(output, GeneratorOutput):
-                            # Create runner finish event with error and stop the loop
-                            current_error = (
-                                f"Expected GeneratorOutput, but got {type(output)}"
-                            )
-                            # create a step output for the error
-                            step_output = StepOutput(
-                                step=step_count,
-                                action=None,
-                                function=None,
-                                observation=current_error,
-                            )
-                            self.step_history.append(step_output)
-                            step_count += 1
-                            break
+                            if not isinstance(output, GeneratorOutput):
+                                # Create runner finish event with error and stop the loop
+                                current_error = (
+                                    f"Expected GeneratorOutput, but got {type(output)}"
+                                )
+                                # create a step output for the error
+                                step_output = StepOutput(
+                                    step=step_count,
+                                    action=None,
+                                    function=None,
+                                    observation=current_error,
+                                )
+                                self.step_history.append(step_output)
+                                step_count += 1
+                                break
  
 
 
-                        function = output.data
+                            function = output.data
 
-                        log.debug(f"function: {function}")
-                        if function is None:
-                            error_msg = f"Run into error: {output.error}, raw response: {output.raw_response}"
-                            # Handle recoverable vs unrecoverable errors
-                            if output.error is not None:
-                                if _is_unrecoverable_error(output.error):
-                                    # Unrecoverable errors: context too long, rate limit, model not found
-                                    current_error = output.error
-                                    step_output = StepOutput(
-                                        step=step_count,
-                                        action=None,
-                                        function=None,
-                                        observation=f"Unrecoverable error: {output.error}",
-                                    )
-                                    self.step_history.append(step_output)
-                                    step_count += 1
-                                    break  # Stop execution for unrecoverable errors
-                            # Recoverable errors: JSON format errors, parsing errors, etc.
-                            current_error = output.error
-                            step_output = StepOutput(
-                                step=step_count,
-                                action=None,
-                                function=None,
-                                observation=current_error,
-                            )
-                            self.step_history.append(step_output)
-                            step_count += 1
+                            log.debug("function: %s", function)
+                            if function is None:
+                                error_msg = f"Run into error: {output.error}, raw response: {output.raw_response}"
+                                # Handle recoverable vs unrecoverable errors
+                                if output.error is not None:
+                                    if _is_unrecoverable_error(output.error):
+                                        # Unrecoverable errors: context too long, rate limit, model not found
+                                        current_error = output.error
+                                        step_output = StepOutput(
+                                            step=step_count,
+                                            action=None,
+                                            function=None,
+                                            observation=f"Unrecoverable error: {output.error}",
+                                        )
+                                        self.step_history.append(step_output)
+                                        step_count += 1
+                                        break  # Stop execution for unrecoverable errors
+                                # Recoverable errors: JSON format errors, parsing errors, etc.
+                                current_error = output.error
+                                step_output = StepOutput(
+                                    step=step_count,
+                                    action=None,
+                                    function=None,
+                                    observation=current_error,
+                                )
+                                self.step_history.append(step_output)
+                                step_count += 1
 
-                            continue  # Continue to next step for recoverable errors`
+                                continue  # Continue to next step for recoverable errors`
 
 
 
-                    thinking = output.thinking if hasattr(output, 'thinking') else None
-                    if function is not None:
-                        # add a function id
-                        function.id = str(uuid.uuid4())
-                        if thinking is not None and self.is_thinking_model:
-                            function.thought = thinking
+                        thinking = output.thinking if hasattr(output, 'thinking') else None
+                        if function is not None:
+                            # add a function id
+                            function.id = str(uuid.uuid4())
+                            if thinking is not None and self.is_thinking_model:
+                                function.thought = thinking
                             
                             
 
-                    if self._check_last_step(function):
-                        answer = self._get_final_answer(function)
-                        # Wrap final output in RunnerResult
-                        last_output = RunnerResult(
-                            answer=answer,
-                            step_history=self.step_history.copy(),
-                            error=current_error,
-                            # ctx=self.ctx,
-                        )
+                        is_final = self._check_last_step(function)
+                        if is_final:
+                            if validator_build is not None:
+                                await asyncio.wrap_future(validator_build)
+                            answer = await self._aget_final_answer(function)
+                            # Wrap final output in RunnerResult
+                            # the run ends here, share the history instead of copying it
+                            last_output = RunnerResult(
+                                answer=answer,
+                                step_history=self.step_history,
+                                error=current_error,
+                                # ctx=self.ctx,
+                            )
 
-                        # Add assistant response to conversation memory
-                        if self.use_conversation_memory:
-                            self.conversation_memory.add_assistant_response(
-                                AssistantResponse(
-                                    response_str=answer,
-                                    metadata={
-                                        "step_history": self.step_history.copy()
-                                    },
+                            # Add assistant response to conversation memory
+                            if self.use_conversation_memory:
+                                self.conversation_memory.add_assistant_response(
+                                    AssistantResponse(
+                                        response_str=answer,
+                                        metadata={
+                                            "step_history": last_output.step_history
+                                        },
+                                    )
                                 )
-                            )
 
 
 
-                        step_count += 1  # Increment step count before breaking
+                            step_count += 1  # Increment step count before breaking
                             
-                        break
+                            break
 
-                    # Create tool span for function execution
-                    with tool_span(
-                        tool_name=function.name,
-                        function_name=function.name,
-                        function_args=function.args,
-                        function_kwargs=function.kwargs,
-                    ) as tool_span_instance:
-                        function_results = await self._tool_execute_async(
-                            func=function
-                        )
-                        function_output = function_results.output
-                        # add the process of the generator and async generator
-                        real_function_output = None
+                        # Create tool span for function execution
+                        with tool_span(
+                            tool_name=function.name,
+                            function_name=function.name,
+                            function_args=function.args,
+                            function_kwargs=function.kwargs,
+                        ) as tool_span_instance:
+                            function_results = await self._tool_execute_async(
+                                func=function
+                            )
+                            function_output = function_results.output
+                            # add the process of the generator and async generator
+                            real_function_output = None
                         
-                        # Handle generator outputs similar to astream implementation
-                        if inspect.iscoroutine(function_output):
-                            real_function_output = await function_output
-                        elif inspect.isasyncgen(function_output):
-                            # Collect all values from async generator
-                            collected_items = []
-                            async for item in function_output:
-                                if isinstance(item, ToolCallActivityRunItem):
-                                    # Skip activity items in acall
-                                    continue
-                                else:
-                                    collected_items.append(item)
-                            # Use collected items as output
-                            real_function_output = collected_items
-                        elif inspect.isgenerator(function_output):
-                            # Collect all values from sync generator
-                            collected_items = []
-                            for item in function_output:
-                                if isinstance(item, ToolCallActivityRunItem):
-                                    # Skip activity items in acall
-                                    continue
-                                else:
-                                    collected_items.append(item)
-                            # Use collected items as output
-                            real_function_output = collected_items
-                        else:
-                            real_function_output = function_output
+                            # Handle generator outputs similar to astream implementation
+                            if inspect.iscoroutine(function_output):
+                                real_function_output = await function_output
+                            elif inspect.isasyncgen(function_output):
+                                # Collect all values from async generator
+                                collected_items = []
+                                async for item in function_output:
+                                    if isinstance(item, ToolCallActivityRunItem):
+                                        # Skip activity items in acall
+                                        continue
+                                    else:
+                                        collected_items.append(item)
+                                # Use collected items as output
+                                real_function_output = collected_items
+                            elif inspect.isgenerator(function_output):
+                                # Collect all values from sync generator
+                                collected_items = []
+                                for item in function_output:
+                                    if isinstance(item, ToolCallActivityRunItem):
+                                        # Skip activity items in acall
+                                        continue
+                                    else:
+                                        collected_items.append(item)
+                                # Use collected items as output
+                                real_function_output = collected_items
+                            else:
+                                real_function_output = function_output
                         
-                        # Use the processed output
-                        function_output = real_function_output
-                        function_output_observation = function_output
+                            # Use the processed output
+                            function_output = real_function_output
+                            function_output_observation = _observation_of(function_output)
 
-                        if isinstance(function_output, ToolOutput) and hasattr(
-                            function_output, "observation"
-                        ):
-                            function_output_observation = (
-                                function_output.observation
+                            # Update tool span attributes using update_attributes for MLflow compatibility
+                            tool_span_instance.span_data.update_attributes(
+                                {"output_result": function_output}
                             )
 
-                        # Update tool span attributes using update_attributes for MLflow compatibility
-                        tool_span_instance.span_data.update_attributes(
-                            {"output_result": function_output}
-                        )
-
-                        step_output: StepOutput = StepOutput(
-                            step=step_count,
-                            action=function,
-                            function=function,
-                            observation=function_output_observation,
-                        )
-                        self.step_history.append(step_output)
-
-                        # Update step span with results
-                        step_span_instance.span_data.update_attributes(
-                            {
-                                "tool_name": function.name,
-                                "tool_output": function_results,
-                                "is_final": self._check_last_step(function),
-                                "observation": function_output_observation,
-                            }
-                        )
-
-                        log.debug(
-                            "The prompt with the prompt template is {}".format(
-                                self.agent.planner.get_prompt(**prompt_kwargs)
+                            step_output: StepOutput = StepOutput(
+                                step=step_count,
+                                action=function,
+                                function=function,
+                                observation=function_output_observation,
                             )
-                        )
-
-                        step_count += 1
+                            self.step_history.append(step_output)
 
-                except Exception as e:
-                    error_msg = f"Error in step {step_count}: {str(e)}"
-                    log.error(error_msg)
+                            # Update step span with results
+                            step_span_instance.span_data.update_attributes(
+                                {
+                                    "tool_name": function.name,
+                                    "tool_output": function_results,
+                                    "is_final": is_final,
+                                    "observation": function_output_observation,
+                                }
+                            )
 
-                    # Create response span for error tracking
-                    with response_span(
-                        answer=error_msg,
-                        result_type="error",
-                        execution_metadata={
-                            "steps_executed": step_count,
-                            "max_steps": self.max_steps,
-                            "workflow_status": "failed",
-                        },
-                        response=None,
-                    ):
-                        pass
+                            # rendering the prompt is O(history), only do it when it is logged
+                            if log.isEnabledFor(logging.DEBUG):
+                                log.debug(
+                                    "The prompt with the prompt template is %s",
+                                    self.agent.planner.get_prompt(**prompt_kwargs),
+                                )
 
-                    # Continue to next step instead of returning
-                    step_count += 1
-                    current_error = error_msg
-                    break
+                            step_count += 1
 
-            # Update runner span with final results
-            # Update runner span with completion info using update_attributes
-            runner_span_instance.span_data.update_attributes(
-                {
-                    "steps_executed": step_count,
-                    "final_answer": last_output.answer if last_output else None,
-                    "workflow_status": "completed",
-                }
-            )
+                    except Exception as e:
+                        error_msg = f"Error in step {step_count}: {str(e)}"
+                        log.error(error_msg)
+
+                        # Create response span for error tracking
+                        with response_span(
+                            answer=error_msg,
+                            result_type="error",
+                            execution_metadata={
+                                "steps_executed": step_count,
+                                "max_steps": self.max_steps,
+                                "workflow_status": "failed",
+                            },
+                            response=None,
+                        ):
+                            pass
 
-            # Create response span for tracking final result
-            with response_span(
-                answer=(
-                    last_output.answer
-                    if last_output
-                    else f"No output generated after {step_count} steps (max_steps: {self.max_steps})"
-                ),
-                result_type=(
-                    type(last_output.answer).__name__ if last_output else "no_output"
-                ),
-                execution_metadata={
-                    "steps_executed": step_count,
-                    "max_steps": self.max_steps,
-                    "workflow_status": "completed" if last_output else "incomplete",
-                },
-                response=last_output,  # can be None if Runner has not finished in the max steps
-            ):
-                pass
+                        # Continue to next step instead of returning
+                        step_count += 1
+                        current_error = error_msg
+                        break
 
-            # Always return a RunnerResult, even if no successful completion
-            return last_output or RunnerResult(
-                answer=current_error or f"No output generated after {step_count} steps (max_steps: {self.max_steps})",
-                step_history=self.step_history.copy(),
-                error=current_error,
-            )
+                return self._complete_run(
+                    runner_span_instance, step_count, last_output, current_error
+                )
+            finally:
+                if validator_build is not None:
+                    _release_validator_build(answer_data_type, validator_build)
         
     
     def astream(
@@ -1232,11 +1340,19 @@ class Runner(Component):
 
         self.reset_cancellation()
 
-        # Store the task so we can cancel it if needed
-        self._current_task = asyncio.get_event_loop().create_task(
-            self.impl_astream(prompt_kwargs, model_kwargs, use_cache, id, result)
-        )
-        result._run_task = self._current_task
+        def start_run() -> asyncio.Task:
+            # Store the task so we can cancel it if needed
+            self._current_task = asyncio.get_running_loop().create_task(
+                self.impl_astream(prompt_kwargs, model_kwargs, use_cache, id, result)
+            )
+            return self._current_task
+
+        if is_running_in_event_loop():
+            result._run_task = start_run()
+        else:
+            # no running loop to schedule on (sync caller, worker thread): start on the loop
+            # that consumes the result instead of a loop that may never run
+            result._start_run = start_run
         return result
 
     async def impl_astream(
@@ -1269,36 +1385,16 @@ class Runner(Component):
         workflow_status: Literal["streaming", "stream_completed", "stream_failed", "stream_incomplete"] = "streaming"
         # Create runner span for tracing streaming execution
         with runner_span(
-            runner_id=id or f"stream_runner_{hash(str(prompt_kwargs))}",
+            runner_id=id or _default_runner_id("stream_runner", prompt_kwargs),
             max_steps=self.max_steps,
             workflow_status= workflow_status,
         ) as runner_span_instance:
             
             # Reset cancellation flag at start of new execution
-            self.step_history = []
-            prompt_kwargs = prompt_kwargs.copy() if prompt_kwargs else {}
-
-            prompt_kwargs["step_history"] = self.step_history
-            if self.use_conversation_memory:
-                # Reset any pending query state before starting a new query
-                self.conversation_memory.reset_pending_query()
-
-                prompt_kwargs["chat_history_str"] = self.conversation_memory()
-                # save the user query to the conversation memory
-
-                # meta data is all keys in the list of context_str
-                query_metadata = {"context_str": prompt_kwargs.get("context_str", None)}
-                self.conversation_memory.add_user_query(
-                    UserQuery(
-                        query_str=prompt_kwargs.get("input_str", None),
-                        metadata=query_metadata,
-                    )
-                )
-            # a reference to the step history
-            # set maximum number of steps for the planner into the prompt
-            prompt_kwargs["max_steps"] = self.max_steps
+            prompt_kwargs = self._start_run(prompt_kwargs)
 
-            model_kwargs = model_kwargs.copy() if model_kwargs else {}
+            # never mutated here: the planner composes its own dict from it
+            model_kwargs = model_kwargs or {}
             step_count = 0
             final_output_item = None
             current_error = None
@@ -1323,11 +1419,12 @@ class Runner(Component):
                         step_number=step_count, action_type="stream_planning"
                     ) as step_span_instance:
                         # important to ensure the prompt at each step is correct
-                        log.debug(
-                            "The prompt with the prompt template is {}".format(
-                                self.agent.planner.get_prompt(**prompt_kwargs)
+                        # rendering the prompt is O(history), only do it when it is logged
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug(
+                                "The prompt with the prompt template is %s",
+                                self.agent.planner.get_prompt(**prompt_kwargs),
                             )
-                        )
 
                         # Check cancellation before calling planner
                         # TODO seems slightly unnecessary we are calling .cancel on the task in cancel which will raise this exception regardless unless we want to terminate earlier by checking the cancelled field
@@ -1345,7 +1442,12 @@ class Runner(Component):
                         # Track token usage
                         step_tokens = self._update_token_consumption()
                         if step_tokens > 0:
-                            log.debug(f"Step {step_count} - Prompt tokens: {step_tokens}, Total: {self._token_consumption['total_prompt_tokens']}")
+                            log.debug(
+                                "Step %s - Prompt tokens: %s, Total: %s",
+                                step_count,
+                                step_tokens,
+                                self._token_consumption["total_prompt_tokens"],
+                            )
 
                         if not isinstance(output, GeneratorOutput):
                             # Create runner finish event with error and stop the loop
@@ -1372,17 +1474,24 @@ class Runner(Component):
                         # handle the generator output data and error
                         wrapped_event = None
 
-                        if isinstance(output.raw_response, AsyncIterable):
+                        # what isinstance(..., AsyncIterable) checks, without the ABC machinery
+                        # that misses its cache for every non-streaming response type
+                        if hasattr(output.raw_response, "__aiter__"):
                             log.debug(
-                                f"Streaming raw response from planner: {output.raw_response}"
+                                "Streaming raw response from planner: %s",
+                                output.raw_response,
                             )
                             # Streaming llm call - iterate through the async generator
+                            # runs once per token: resolve the per-chunk calls once
+                            is_cancelled = self.is_cancelled
+                            aput = streaming_result.aput
                             async for event in output.raw_response:
                                 # TODO seems slightly unnecessary we are calling .cancel on the task in cancel which will raise this exception regardless
-                                if self.is_cancelled():
+                                if is_cancelled():
                                     raise asyncio.CancelledError("Execution cancelled by user")
                                 wrapped_event = RawResponsesStreamEvent(data=event)
-                                streaming_result.put_nowait(wrapped_event)
+                                # waits for a consumer lagging behind the llm stream
+                                await aput(wrapped_event)
 
                         else: # non-streaming cases
                             # yield the final planner response
@@ -1464,10 +1573,11 @@ class Runner(Component):
                         # TODO: simplify this
                         tool_call_id = function.id
                         tool_call_name = function.name
-                        log.debug(f"function: {function}")
+                        log.debug("function: %s", function)
 
-                        if self._check_last_step(function): # skip stepoutput 
-                            answer = self._get_final_answer(function)
+                        is_final = self._check_last_step(function)
+                        if is_final: # skip stepoutput 
+                            answer = await self._aget_final_answer(function)
                             final_output_item = await self._process_stream_final_step(
                                 answer=answer,
                                 step_count=step_count,
@@ -1482,7 +1592,6 @@ class Runner(Component):
 
                         function_output_observation = None
                         function_result = None
-                        print("function name", function.name)
                         complete_step = False
                         if (
                             self.permission_manager
@@ -1541,14 +1650,16 @@ class Runner(Component):
                         self.step_history.append(step_output)
 
                         # Update step span with results (for both recoverable errors and normal function execution)
-                        step_span_instance.span_data.update_attributes(
-                            {
-                                "tool_name": function.name if function else None,
-                                "tool_output": function_result,
-                                "is_final": self._check_last_step(function),
-                                "observation": function_output_observation,
-                            }
-                        )
+                        # a no-op span (tracing disabled or no active trace) is never exported
+                        if not isinstance(step_span_instance, NoOpSpan):
+                            step_span_instance.span_data.update_attributes(
+                                {
+                                    "tool_name": function.name if function else None,
+                                    "tool_output": function_result,
+                                    "is_final": is_final,
+                                    "observation": function_output_observation,
+                                }
+                            )
 
                         # Emit step completion event (with error if any)
                         step_item = StepRunItem(data=step_output)
@@ -1576,7 +1687,7 @@ class Runner(Component):
 
                     # Store cancellation result
                     streaming_result.answer = cancel_msg
-                    streaming_result.step_history = self.step_history.copy()
+                    streaming_result.step_history = self.step_history
                     streaming_result._is_complete = True 
 
                     # Add cancellation response to conversation memory
@@ -1585,7 +1696,7 @@ class Runner(Component):
                             AssistantResponse(
                                 response_str="I apologize, but the execution was cancelled by the user.",
                                 metadata={
-                                    "step_history": self.step_history.copy(),
+                                    "step_history": self.step_history,
                                     "status": "cancelled",
                                     "timestamp": datetime.now().isoformat()
                                 }
@@ -1619,28 +1730,20 @@ class Runner(Component):
                 runner_result = RunnerResult(
                     answer=f"No output generated after {step_count} steps (max_steps: {self.max_steps})",
                     error=current_error,
-                    step_history=self.step_history.copy(),
-
+                    step_history=self.step_history,
                 )
                 final_output_item = FinalOutputItem(data=runner_result)
 
                 workflow_status = "stream_incomplete"
                 current_error = f"No output generated after {step_count} steps (max_steps: {self.max_steps})"
 
-
-            runner_span_instance.span_data.update_attributes(
-                {
-                    "steps_executed": step_count,
-                    "final_answer": final_output_item.data.answer if final_output_item.data else None,
-                    "workflow_status": workflow_status,
-                }
-            )
-
             # create runner result with or without error
-
+            # the run span's final attributes are set in create_response_span
+            # the run is over and the next one rebinds self.step_history, so the results, the
+            # streaming result and the memory metadata share it instead of copying it each
             runner_result = RunnerResult(
                 answer=final_output_item.data.answer if final_output_item.data else None,
-                step_history=self.step_history.copy(),
+                step_history=self.step_history,
                 error=current_error,
             )
 
@@ -1711,7 +1814,8 @@ class Runner(Component):
         # else:
         result = await self.agent.tool_manager.execute_func_async(func=func)
 
-        if not isinstance(result, FunctionOutput):
+        # ToolManager.execute_func_async already guarantees a FunctionOutput, only re-check in debug runs
+        if __debug__ and not isinstance(result, FunctionOutput):
             raise ValueError("Result is not a FunctionOutput")
         return result
 
@@ -1755,21 +1859,17 @@ class Runner(Component):
 
             function_result = await self._tool_execute_async(
                 func=function, streaming_result=streaming_result
-            )  # everything must be wrapped in FunctionOutput
-
-            if not isinstance(function_result, FunctionOutput):
-                raise ValueError(
-                    f"Result must be wrapped in FunctionOutput, got {type(function_result)}"
-                )
+            )  # everything must be wrapped in FunctionOutput, _tool_execute_async checks it
 
             function_output = function_result.output
             real_function_output = None
 
             # TODO: validate when the function is a generator
 
-            if inspect.iscoroutine(function_output):
+            # the same type checks as inspect.iscoroutine/isasyncgen/isgenerator, without the calls
+            if isinstance(function_output, CoroutineType):
                 real_function_output = await function_output
-            elif inspect.isasyncgen(function_output):
+            elif isinstance(function_output, AsyncGeneratorType):
                 async for item in function_output:
                     if isinstance(item, ToolCallActivityRunItem):
                         # add the tool_call_id to the item
@@ -1778,10 +1878,13 @@ class Runner(Component):
                             name="agent.tool_call_activity", item=item
                         )
                         streaming_result.put_nowait(tool_call_event)
+                        # the tool only suspends when it awaits i/o, yield to the loop so the
+                        # consumer drains the activity while the tool keeps running
+                        await asyncio.sleep(0)
                     else:
                         real_function_output = item
 
-            elif inspect.isgenerator(function_output):
+            elif isinstance(function_output, GeneratorType):
                 for item in function_output:
                     if isinstance(item, ToolCallActivityRunItem):
                         # add the tool_call_id to the item
@@ -1790,6 +1893,9 @@ class Runner(Component):
                             name="agent.tool_call_activity", item=item
                         )
                         streaming_result.put_nowait(tool_call_event)
+                        # a sync generator never suspends, yield to the loop so the consumer
+                        # receives the activity while the tool keeps running
+                        await asyncio.sleep(0)
                     else:
                         real_function_output = item
             else:
@@ -1810,18 +1916,11 @@ class Runner(Component):
             streaming_result.put_nowait(call_complete_event)
 
             function_output = real_function_output
-            function_output_observation = function_output
-
-            if isinstance(function_output, ToolOutput) and hasattr(
-                function_output, "observation"
-            ):
-                function_output_observation = (
-                    function_output.observation
-                )
+            function_output_observation = _observation_of(function_output)
             # Update tool span attributes using update_attributes for MLflow compatibility
-
-            tool_span_instance.span_data.update_attributes(
-                {"output_result": real_function_output}
-            )
+            if not isinstance(tool_span_instance, NoOpSpan):
+                tool_span_instance.span_data.update_attributes(
+                    {"output_result": real_function_output}
+                )
 
             return function_result, function_output, function_output_observation
@@ -6,6 +6,7 @@ from collections import OrderedDict
 
 
 import enum
+import weakref
 from copy import deepcopy
 from dataclasses import (
     field,
@@ -38,6 +39,9 @@ __all__ = [
 ]
 logger = logging.getLogger(__name__)
 
+# classes whose field metadata has already been checked in DataClass.__post_init__
+_desc_checked_classes: "weakref.WeakSet[type]" = weakref.WeakSet()
+
 
 class DataClassFormatType(enum.Enum):
     r"""The format type for the DataClass schema."""
@@ -192,13 +196,17 @@ class DataClass:
     __output_fields__: List[str] = []
 
     def __post_init__(self):
-
+        # field metadata is defined on the class, so it only needs to be checked once per class
+        cls = self.__class__
+        if cls in _desc_checked_classes:
+            return
         for f in fields(self):
             if "desc" not in f.metadata and "description" not in f.metadata:
 
                 logger.debug(
-                    f"Class {  self.__class__.__name__} Field {f.name} is missing 'desc' in metadata"
+                    f"Class {cls.__name__} Field {f.name} is missing 'desc' in metadata"
                 )
+        _desc_checked_classes.add(cls)
 
     @classmethod
     def get_task_desc(cls) -> str:
@@ -556,7 +556,8 @@ class Component:
         """
         # The default `bicall` in this class raises NotImplementedError,
         # so we can check if the method is still the same one as in `MyModule`.
-        return self.bicall.__func__ is not Component.bicall
+        # Looked up on the class so that no bound method is created on every call.
+        return type(self).bicall is not Component.bicall
 
     async def acall(self, *args, **kwargs):
         r"""API call, file io."""
@@ -1,14 +1,22 @@
 """
 Tool is LLM's extended capability which is one of the core design pattern of Agent. All tools can be wrapped in a FunctionTool class.
 This helps to standardize the tool interface and metadata to communicate with the Agent.
+
+Set ``ADALFLOW_USE_UVLOOP=1`` to install `uvloop <https://github.com/MagicStack/uvloop>`_ as the event loop policy
+when this module is imported, or call :func:`install_uvloop` yourself. It speeds up fanning out many async tool calls.
 """
 
-from typing import Any, Optional, Callable, Awaitable, Union
+from typing import Any, Optional, Callable, Awaitable, Union, List, Tuple, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
 from inspect import ismethod
 import inspect
+import copy
+import functools
 import logging
+import os
 import asyncio
-import nest_asyncio
+import threading
+import weakref
 from enum import Enum, auto
 
 
@@ -23,15 +31,238 @@ from adalflow.optim.grad_component import FunGradComponent
 from adalflow.core.functional import (
     get_fun_schema,
 )
-from adalflow.utils import printc
+from adalflow.utils.lazy_import import safe_import, OptionalPackages
 from inspect import signature
 
 AsyncCallable = Callable[..., Awaitable[Any]]
 
 log = logging.getLogger(__name__)
 
+# FunctionDefinition built for each underlying callable, so that wrapping the same
+# function in many tools only pays for the signature/schema introspection once.
+# Each tool receives a copy, never the cached instance itself.
+_FN_DEFINITION_CACHE: "weakref.WeakKeyDictionary[Callable, FunctionDefinition]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _copy_schema(value: Any) -> Any:
+    r"""Copy the dicts and lists of a JSON-like schema, sharing every other value."""
+    if isinstance(value, dict):
+        return {key: _copy_schema(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_schema(item) for item in value]
+    return value
+
+
+_nest_asyncio_applied = False
+
+
+def _ensure_nest_asyncio() -> bool:
+    r"""Patch asyncio with ``nest_asyncio`` once per process.
+
+    nest_asyncio can only patch pure-python ``asyncio.BaseEventLoop`` loops. With any other loop (e.g. uvloop),
+    or an event loop policy that creates them, nothing is patched.
+
+    Returns:
+        bool: Whether the running loop can be re-entered with ``run_until_complete``.
+    """
+    global _nest_asyncio_applied
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        patchable = isinstance(loop, asyncio.BaseEventLoop)
+    elif _nest_asyncio_applied:
+        patchable = True
+    else:
+        # apply() patches the policy's loop, a custom policy (uvloop) may not make a BaseEventLoop
+        patchable = isinstance(
+            asyncio.get_event_loop_policy(), asyncio.DefaultEventLoopPolicy
+        )
+    if not patchable:
+        log.debug("Skipping nest_asyncio: the loop is not an asyncio.BaseEventLoop")
+        return False
+    if not _nest_asyncio_applied:
+        import nest_asyncio
+
+        nest_asyncio.apply()
+        _nest_asyncio_applied = True
+    return True
+
+
+class _BackgroundAsyncRuntime:
+    r"""One event loop thread and one thread pool shared by all function tools.
+
+    The loop runs async functions called from sync code, avoiding a new loop per call with ``asyncio.run``,
+    and the pool runs blocking sync functions off the caller's thread. Both are created on first use.
+    """
+
+    def __init__(self, max_workers: int):
+        self._max_workers = max_workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="adalflow-function-tool-loop",
+                        daemon=True,
+                    ).start()
+                    self._loop = loop
+        return self._loop
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="adalflow-function-tool",
+                    )
+        return self._executor
+
+    def submit_coroutine(self, coro: Awaitable[Any]) -> Future:
+        r"""Schedule a coroutine on the background loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run_sync(self, coro: Awaitable[Any]) -> Any:
+        r"""Run a coroutine on the background loop and block until it completes.
+
+        Called from a coroutine that already runs on the background loop (an async tool calling another tool
+        synchronously), the loop cannot wait for itself, so the coroutine runs on a new loop in a new thread.
+        """
+        if (
+            self._loop is not None
+            and is_running_in_event_loop()
+            and asyncio.get_running_loop() is self._loop
+        ):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                return pool.submit(asyncio.run, coro).result()
+        return self.submit_coroutine(coro).result()
+
+    def submit_blocking(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        r"""Run a blocking function on the shared thread pool."""
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def run_in_executor(
+        self, fn: Callable, *args: Any, **kwargs: Any
+    ) -> "asyncio.Future[Any]":
+        r"""Await a blocking function on the shared thread pool from the running loop.
+
+        Unlike ``asyncio.to_thread``, the context variables are not copied to the thread.
+        """
+        return asyncio.get_running_loop().run_in_executor(
+            self.executor, functools.partial(fn, *args, **kwargs)
+        )
+
+
+_background_runtime = _BackgroundAsyncRuntime(
+    max_workers=min(32, (os.cpu_count() or 1) * 4)
+)
+
+
+_uvloop_installed = False
+
+
+def install_uvloop() -> bool:
+    r"""Use uvloop as the asyncio event loop policy.
+
+    Loops created afterwards, including the one used for async tools called from sync code, are uvloop loops.
+    Calling it again is a no-op.
+
+    uvloop and ``nest_asyncio`` are mutually exclusive: once nest_asyncio has patched asyncio (the first time
+    an async tool is called synchronously from a running loop), its patched ``asyncio.run`` cannot drive
+    uvloop loops, so the policy is left unchanged and a warning is logged.
+
+    Returns:
+        bool: Whether uvloop is the event loop policy.
+
+    Raises:
+        ImportError: If uvloop is not installed.
+    """
+    global _uvloop_installed
+    if _uvloop_installed:
+        return True
+    if _nest_asyncio_applied:
+        log.warning(
+            "Not installing uvloop: nest_asyncio is already applied and cannot run uvloop loops. "
+            "Call install_uvloop (or set ADALFLOW_USE_UVLOOP=1) before running any tool."
+        )
+        return False
+    uvloop = safe_import(
+        OptionalPackages.UVLOOP.value[0], OptionalPackages.UVLOOP.value[1]
+    )
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    _uvloop_installed = True
+    log.info("Installed uvloop as the asyncio event loop policy")
+    return True
+
+
+if os.environ.get("ADALFLOW_USE_UVLOOP", "").lower() in ("1", "true", "yes"):
+    try:
+        install_uvloop()
+    except ImportError as e:
+        log.warning(f"ADALFLOW_USE_UVLOOP is set but uvloop is unavailable: {e}")
+
+
+def _jit_with_fallback(fn: Callable) -> Callable:
+    r"""Compile ``fn`` with ``numba.njit(cache=True)`` on its first call.
+
+    Functions without a source file (defined in a notebook, REPL or ``exec``) cannot use numba's on-disk
+    cache and are compiled without it. If numba cannot compile the function for the given arguments, the
+    original ``fn`` is used from then on.
+    """
+    numba = safe_import(
+        OptionalPackages.NUMBA.value[0], OptionalPackages.NUMBA.value[1]
+    )
+    from numba.core import errors as numba_errors
+
+    # UnsupportedBytecodeError, in recent numba versions, does not derive from NumbaError
+    compile_errors = (
+        numba_errors.NumbaError,
+        getattr(numba_errors, "UnsupportedBytecodeError", numba_errors.NumbaError),
+    )
+
+    try:
+        impl = numba.njit(cache=True)(fn)
+    except RuntimeError as e:
+        # raised by numba's cache locator when it finds no file to cache next to
+        log.debug("numba cannot cache %s, compiling without cache: %s", fn, e)
+        impl = numba.njit(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        nonlocal impl
+        try:
+            return impl(*args, **kwargs)
+        except compile_errors as e:
+            # raised while compiling, before fn runs, so calling fn below runs it once
+            log.warning("numba could not compile %s, falling back to python: %s", fn, e)
+            impl = fn
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+# asyncio._get_running_loop returns None instead of raising RuntimeError, which keeps
+# the exception machinery off the frequently called is_running_in_event_loop.
+# Resolved once here rather than with a hasattr + module attribute lookup per call.
+_get_running_loop = getattr(asyncio, "_get_running_loop", None)
+
 
 def is_running_in_event_loop() -> bool:
+    if _get_running_loop is not None:
+        # only a running loop is ever registered as the running loop of a thread
+        return _get_running_loop() is not None
     try:
         loop = asyncio.get_running_loop()
         if loop.is_running():
@@ -57,6 +288,38 @@ def find_instance_name_from_self(instance):
     return None
 
 
+def _build_fn_definition(fn: Callable) -> FunctionDefinition:
+    r"""Create the :class:`FunctionDefinition` of a function from its signature and docstring."""
+    name = fn.__name__
+    docstring = fn.__doc__
+    fn_signature = signature(fn)
+    signature_str = str(fn_signature)
+
+    # Get the class that owns the method, if applicable
+    cls_name = None
+    if ismethod(fn):  # Check if it's a bound method
+        cls_name = fn.__self__.__class__.__name__
+
+    # Build the description
+    description = f"{name}{signature_str}\n"
+    if cls_name:
+        description += f"Belongs to class: {cls_name}\n"
+    if docstring:
+        description += f"Docstring: {docstring}\n"
+
+    # Get function parameters schema
+    fn_parameters = get_fun_schema(name, fn, sig=fn_signature)
+
+    name = cls_name + "_" + name if cls_name else name
+    # create a unique identifier as the class method name
+
+    return FunctionDefinition(
+        func_name=name,
+        func_desc=description,
+        func_parameters=fn_parameters,
+    )
+
+
 # Specific function types supported by FunctionTool:
 # - Regular functions (sync/async)
 # - Generator functions (sync/async)
@@ -127,6 +390,8 @@ class FunctionTool(Component):
             - Via `call` with args and kwargs.
             - Via `eval`, without any context or sandboxing.
             - Via sandboxed execution directly using `sandbox_exec`.
+    - Optionally compiles compute-bound sync functions with numba (``numba=True``); call :meth:`warmup` with
+      example arguments to pay the compilation cost up front.
 
     A FunctionTool allows other GradComponent(as a tool) to pass through correctly.
     """
@@ -143,11 +408,11 @@ class FunctionTool(Component):
         definition: Optional[FunctionDefinition] = None,
         require_approval: bool = False,
         pre_execute_callback: Optional[Callable] = None,
+        numba: bool = False,
     ):
         super().__init__(
             name="FunctionTool", desc="A component calls and executes a function."
         )
-        nest_asyncio.apply()
         assert fn is not None, "fn must be provided"
 
         # TODO: support FunGradComponent later.
@@ -162,14 +427,42 @@ class FunctionTool(Component):
         ]
         self.class_instance = self._autodetect_class_instance(fn)
         if isinstance(fn, FunGradComponent):
-            print(f"FunctionTool: {fn} is a component")
+            log.debug("FunctionTool: %s is a component", fn)
             self.definition = (
                 definition or self._create_fn_definition_for_grad_component(fn)
             )
         else:
             self.definition = definition or self._create_fn_definition()
+        # format -> (definition, serialized definition), see definition_json/definition_yaml
+        self._definition_strs: Dict[str, Tuple[FunctionDefinition, str]] = {}
+        # the definition above is built from the original fn, numba's dispatcher has no signature
+        self._numba = numba
+        if numba:
+            if self.function_type != FunctionType.SYNC or not inspect.isfunction(fn):
+                raise ValueError(
+                    f"numba=True only supports plain sync functions, got {fn}"
+                )
+            self.fn = _jit_with_fallback(fn)
         if self._is_async:
-            log.info(f"FunctionTool: {fn} is async: {self._is_async}")
+            log.info("FunctionTool: %s is async: %s", fn, self._is_async)
+
+    def _serialized_definition(self, fmt: str) -> str:
+        definition = self.definition
+        cached = self._definition_strs.get(fmt)
+        if cached is None or cached[0] is not definition:
+            text = definition.to_json() if fmt == "json" else definition.to_yaml()
+            cached = self._definition_strs[fmt] = (definition, text)
+        return cached[1]
+
+    @property
+    def definition_json(self) -> str:
+        r"""``definition.to_json()``, serialized once and refreshed when ``definition`` is reassigned."""
+        return self._serialized_definition("json")
+
+    @property
+    def definition_yaml(self) -> str:
+        r"""``definition.to_yaml()``, serialized once and refreshed when ``definition`` is reassigned."""
+        return self._serialized_definition("yaml")
 
     @classmethod
     def detect_function_type(cls, fn: Callable) -> FunctionType:
@@ -237,7 +530,8 @@ class FunctionTool(Component):
     ) -> FunctionDefinition:
         name = fn.fun_name
         docstring = fn.doc_string
-        signature_str = str(signature(fn.fun))
+        fn_signature = signature(fn.fun)
+        signature_str = str(fn_signature)
         cls_name = None
         if ismethod(fn.fun):
             cls_name = fn.fun.__self__.__class__.__name__
@@ -250,7 +544,7 @@ class FunctionTool(Component):
                 if isinstance(docstring, str)
                 else f"{name}{signature_str}\nDocstring:{docstring.data}"
             ),
-            func_parameters=get_fun_schema(name, fn.fun),
+            func_parameters=get_fun_schema(name, fn.fun, sig=fn_signature),
         )
 
     def _autodetect_class_instance(self, fn: Callable) -> Optional[Any]:
@@ -259,34 +553,25 @@ class FunctionTool(Component):
         return None
 
     def _create_fn_definition(self) -> FunctionDefinition:
+        r"""Get the definition of ``self.fn``, reusing the cached one if the same callable was wrapped before.
 
-        name = self.fn.__name__
-        docstring = self.fn.__doc__
-        signature_str = str(signature(self.fn))
-
-        # Get the class that owns the method, if applicable
-        cls_name = None
-        if ismethod(self.fn):  # Check if it's a bound method
-            cls_name = self.fn.__self__.__class__.__name__
-
-        # Build the description
-        description = f"{name}{signature_str}\n"
-        if cls_name:
-            description += f"Belongs to class: {cls_name}\n"
-        if docstring:
-            description += f"Docstring: {docstring}\n"
-
-        # Get function parameters schema
-        fn_parameters = get_fun_schema(name, self.fn)
-
-        name = cls_name + "_" + name if cls_name else name
-        # create a unique identifier as the class method name
-
-        return FunctionDefinition(
-            func_name=name,
-            func_desc=description,
-            func_parameters=fn_parameters,
-        )
+        Each tool gets its own copy, including the nested dicts and lists of ``func_parameters``, so changing
+        one tool's definition does not affect the others. Default values inside the schema are shared.
+        """
+        if ismethod(self.fn):
+            # a new bound method object is created on every attribute access, its weak key would die at once
+            return _build_fn_definition(self.fn)
+        try:
+            definition = _FN_DEFINITION_CACHE.get(self.fn)
+        except TypeError:
+            # callables that are unhashable or not weak-referenceable are not cached
+            return _build_fn_definition(self.fn)
+        if definition is None:
+            definition = _build_fn_definition(self.fn)
+            _FN_DEFINITION_CACHE[self.fn] = definition
+        definition = copy.copy(definition)
+        definition.func_parameters = _copy_schema(definition.func_parameters)
+        return definition
 
     def forward(self, *args, **kwargs) -> Parameter:
         r"""Forward the function tool."""
@@ -294,16 +579,17 @@ class FunctionTool(Component):
 
     def _call_sync(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
         """Call a sync function."""
-        if self.function_type == FunctionType.SYNC:
+        function_type = self.function_type
+        if function_type == FunctionType.SYNC:
             return fn(*args, **kwargs)
-        elif self.function_type == FunctionType.ASYNC:
-            if is_running_in_event_loop():
+        elif function_type == FunctionType.ASYNC:
+            # re-entering the running loop requires nest_asyncio, which cannot patch every loop type
+            if is_running_in_event_loop() and _ensure_nest_asyncio():
                 loop = asyncio.get_running_loop()
-                task = loop.create_task(fn(*args, **kwargs))
-                return asyncio.run_coroutine_threadsafe(task, loop).result()
+                return loop.run_until_complete(fn(*args, **kwargs))
             else:
-                return asyncio.run(fn(*args, **kwargs))
-        elif self.function_type == FunctionType.SYNC_GENERATOR:
+                return _background_runtime.run_sync(fn(*args, **kwargs))
+        elif function_type == FunctionType.SYNC_GENERATOR:
             return fn(*args, **kwargs)
             # output = []
             # sync_gen = fn(*args, **kwargs)
@@ -311,12 +597,12 @@ class FunctionTool(Component):
             #     output.append(event)
             # return output
 
-        elif self.function_type == FunctionType.ASYNC_GENERATOR:
+        elif function_type == FunctionType.ASYNC_GENERATOR:
             # For async generators in sync context, just return the generator object
             # The runner will handle the collection of events
             return fn(*args, **kwargs)
         else:
-            raise ValueError(f"Unsupported function type: {self.function_type}")
+            raise ValueError(f"Unsupported function type: {function_type}")
 
     def call(self, *args: Any, **kwargs: Any) -> FunctionOutput:
         """
@@ -324,7 +610,7 @@ class FunctionTool(Component):
 
         This method provides a unified sync interface for all function types:
         - SYNC: Calls the function directly
-        - ASYNC: Runs the coroutine in a new event loop (blocks until complete)
+        - ASYNC: Runs the coroutine in a shared background event loop (blocks until complete)
         - SYNC_GENERATOR: Returns the generator object
         - ASYNC_GENERATOR: Runs the async generator and collects all values into a list
 
@@ -354,20 +640,22 @@ class FunctionTool(Component):
             output = self._call_sync(self.fn, *args, **kwargs)
 
         except Exception as e:
-            log.error(f"Error at calling {self.fn}: {e}")
             error = f"Error at calling {self.fn}: {e}"
+            log.error(error)
+
+        # read per call, so reassigning ``definition`` renames the outputs too
+        name = self.definition.func_name
+        func_input = Function(name=name, args=args, kwargs=kwargs)
 
         # Handle Parameter output (training mode)
         if isinstance(output, Parameter):
             if not self.training:
                 raise ValueError(
-                    f"FunctionTool {self.definition.func_name} is in eval mode, but the output is Parameter"
+                    f"FunctionTool {name} is in eval mode, but the output is Parameter"
                 )
             output.data = FunctionOutput(
-                name=self.definition.func_name,
-                input=Function(
-                    name=self.definition.func_name, args=args, kwargs=kwargs
-                ),
+                name=name,
+                input=func_input,
                 output=output.data,
                 error=error,
             )
@@ -375,13 +663,13 @@ class FunctionTool(Component):
 
         # Create FunctionOutput
         function_output = FunctionOutput(
-            name=self.definition.func_name,
-            input=Function(name=self.definition.func_name, args=args, kwargs=kwargs),
+            name=name,
+            input=func_input,
             output=output,
             error=error,
         )
 
-        log.debug(f"call output: {function_output}")
+        log.debug("call output: %s", function_output)
         return function_output
 
     def bicall(self, *args: Any, **kwargs: Any) -> Union[FunctionOutput, Parameter]:
@@ -395,36 +683,38 @@ class FunctionTool(Component):
         # NOTE: special case:
         # self.fn can have both train and eval mode or untrainable as a function.
         try:
-            log.debug(f"bicall args: {args}, kwargs: {kwargs}, fn: {self.fn}")
+            log.debug("bicall args: %s, kwargs: %s, fn: %s", args, kwargs, self.fn)
             # TODO: might to support more types of functions
             output = self.fn(*args, **kwargs)
         except Exception as e:
-            log.error(f"Error at calling {self.fn}: {e}")
             error = f"Error at calling {self.fn}: {e}"
+            log.error(error)
+
+        # read per call, so reassigning ``definition`` renames the outputs too
+        name = self.definition.func_name
+        func_input = Function(name=name, args=args, kwargs=kwargs)
 
         if isinstance(output, Parameter):
             if not self.training:
                 raise ValueError(
-                    f"FunctionTool {self.definition.func_name} is in eval mode, but the output is Parameter"
+                    f"FunctionTool {name} is in eval mode, but the output is Parameter"
                 )
             output.data = FunctionOutput(
-                name=self.definition.func_name,
+                name=name,
                 # raw_input={"args": args, "kwargs": kwargs},
-                input=Function(
-                    name=self.definition.func_name, args=args, kwargs=kwargs
-                ),
+                input=func_input,
                 output=output.data,
                 error=error,
             )
             return output
 
         output = FunctionOutput(
-            name=self.definition.func_name,
-            input=Function(name=self.definition.func_name, args=args, kwargs=kwargs),
+            name=name,
+            input=func_input,
             output=output,
             error=error,
         )
-        log.debug(f"function output: {output}")
+        log.debug("function output: %s", output)
         return output
 
     async def acall(self, *args, **kwargs) -> Union[FunctionOutput, Parameter]:
@@ -440,58 +730,100 @@ class FunctionTool(Component):
         Note: For generators, users need to iterate over the generator themselves.
         """
         output, error = None, None
-        log.debug(f"output arguments: {args}, {kwargs}")
+        log.debug("output arguments: %s, %s", args, kwargs)
+        # bind once instead of looking up the instance attributes in every branch
+        fn, function_type = self.fn, self.function_type
 
         try:
-            if self.function_type == FunctionType.SYNC:
+            if function_type == FunctionType.SYNC:
                 # Sync function - call directly
-                output = self.fn(*args, **kwargs)
-                log.debug(f"output in synchronous function call: {output}")
+                output = fn(*args, **kwargs)
+                log.debug("output in synchronous function call: %s", output)
 
-            elif self.function_type == FunctionType.ASYNC:
+            elif function_type == FunctionType.ASYNC:
                 # Async function - await the coroutine
-                output = await self.fn(*args, **kwargs)
+                output = await fn(*args, **kwargs)
 
-            elif self.function_type == FunctionType.SYNC_GENERATOR:
+            elif function_type == FunctionType.SYNC_GENERATOR:
                 # Sync generator - return the generator object
-                output = self.fn(*args, **kwargs)
+                output = fn(*args, **kwargs)
 
-            elif self.function_type == FunctionType.ASYNC_GENERATOR:
+            elif function_type == FunctionType.ASYNC_GENERATOR:
                 # Async generator - return the async generator object
-                output = self.fn(*args, **kwargs)
+                output = fn(*args, **kwargs)
 
             else:
-                raise ValueError(f"Unsupported function type: {self.function_type}")
+                raise ValueError(f"Unsupported function type: {function_type}")
 
         except Exception as e:
-            log.error(f"Error at calling {self.fn}: {e}")
-            error = f"Error at calling {self.fn}: {e}"
+            error = f"Error at calling {fn}: {e}"
+            log.error(error)
+
+        # read per call, so reassigning ``definition`` renames the outputs too
+        name = self.definition.func_name
+        func_input = Function(name=name, args=args, kwargs=kwargs)
 
         # Handle Parameter output (training mode)
         if isinstance(output, Parameter):
             if not self.training:
                 raise ValueError(
-                    f"FunctionTool {self.definition.func_name} is in eval mode, but the output is Parameter"
+                    f"FunctionTool {name} is in eval mode, but the output is Parameter"
                 )
             output.data = FunctionOutput(
-                name=self.definition.func_name,
-                input=Function(
-                    name=self.definition.func_name, args=args, kwargs=kwargs
-                ),
+                name=name,
+                input=func_input,
                 output=output.data,
                 error=error,
             )
             return output
 
         function_output = FunctionOutput(
-            name=self.definition.func_name,
-            input=Function(name=self.definition.func_name, args=args, kwargs=kwargs),
+            name=name,
+            input=func_input,
             output=output,
             error=error,
         )
 
         return function_output
 
+    @classmethod
+    def execute_many(
+        cls, calls: List[Tuple["FunctionTool", Tuple[Any, ...], Dict[str, Any]]]
+    ) -> List[Future]:
+        r"""Execute many tool calls concurrently.
+
+        Sync tools are submitted to a shared thread pool and async tools are scheduled
+        on the shared background event loop, so blocking tools run in parallel with each other
+        and with the async ones.
+
+        Args:
+            calls: A list of ``(tool, args, kwargs)`` tuples.
+
+        Returns:
+            List[Future]: One ``concurrent.futures.Future`` per call, in the same order,
+            each resolving to the output of ``tool.call`` or ``tool.acall``.
+
+        Example:
+
+        .. code-block:: python
+
+            futures = FunctionTool.execute_many(
+                [(search_tool, ("adalflow",), {}), (fetch_tool, (), {"url": url})]
+            )
+            outputs = [future.result() for future in futures]
+        """
+        futures: List[Future] = []
+        for tool, args, kwargs in calls:
+            if tool._is_async:
+                futures.append(
+                    _background_runtime.submit_coroutine(tool.acall(*args, **kwargs))
+                )
+            else:
+                futures.append(
+                    _background_runtime.submit_blocking(tool.call, *args, **kwargs)
+                )
+        return futures
+
     # async def acall(self, *args, **kwargs) -> Union[FunctionOutput, Parameter]:
     #     """
     #     Async call the function with automatic event collection for generators.
@@ -562,89 +894,109 @@ class FunctionTool(Component):
 
     #     return function_output
 
-    # def execute(self, *args, **kwargs) -> FunctionOutput:
-    #     r"""Execute the function synchronously or asynchronously based on the function type.
-
-    #     No matter of the function type, you can run the function using both asyncio and without asyncio.
-
-    #     Use it with caution as it might block the event loop.
-
-    #     Example:
-
-    #     .. code-block:: python
-
-    #         import asyncio
-    #         import time
-
-    #         async def async_function_1():
-    #             await asyncio.sleep(1)
-    #             return "Function 1 completed"
-
-    #         def sync_function_1():
-    #             time.sleep(1)
-    #             return "Function 1 completed"
-
-    #         async def async_function_2():
-    #             await asyncio.sleep(2)
-    #             return "Function 2 completed"
-
-    #         def sync_function_2():
-    #             time.sleep(2)
-    #             return "Function 2 completed"
-
-    #         async_tool_1 = FunctionTool(async_function_1)
-    #         sync_tool_1 = FunctionTool(sync_function_2)
-    #         async_tool_2 = FunctionTool(async_function_2)
-    #         sync_tool_2 = FunctionTool(sync_function_2)
-
-    #         def run_sync_and_async_mix_without_wait():
-    #             # both sync and async tool can use execute
-    #             # sync tool can also use call
-    #             # takes 5 seconds (1+1+2) + overhead
-    #             start_time = time.time()
-    #             results = [
-    #                 async_tool_1.execute(),
-    #                 sync_tool_1.execute(),
-    #                 sync_tool_2.call(),
-    #             ]
-    #             end_time = time.time()
-    #             print(f"run_sync_and_async_mix_without_wait time: {end_time - start_time}")
-    #             return results
-
-    #         async def run_sync_and_async_mix():
-    #             # both sync and async tool can use execute&to_thread
-    #             # async tool can also use acall without to_thread
-    #             # takes a bit over 2 seconds max(2)
-    #             start_time = time.time()
-    #             results = await asyncio.gather(
-    #                 async_tool_1.execute(),
-    #                 sync_tool_1.execute(),
-    #                 async_tool_2.acall(),
-    #             )
-    #             end_time = time.time()
-    #             print(f"run_sync_and_async_mix time: {end_time - start_time}")
-    #             return results
+    def execute(
+        self, *args, **kwargs
+    ) -> Union[FunctionOutput, Awaitable[FunctionOutput]]:
+        r"""Execute the function synchronously or asynchronously based on the function type.
 
-    #         run_sync_and_async_mix_without_wait()
-    #         asyncio.run(run_sync_and_async_mix())
-    #     """
-    #     if self._is_async:
-    #         log.debug(f"Running async function: {self.fn}")
-    #         if is_running_in_event_loop():
-    #             result = asyncio.create_task(self.acall(*args, **kwargs))
-    #         else:
-    #             result = asyncio.run(self.acall(*args, **kwargs))
-    #     # NOTE: in juptyer notebook, it is always running in event loop
-    #     else:
-    #         log.debug(f"Running sync function: {self.fn}")
-    #         if is_running_in_event_loop():
-    #             log.debug(f"Running sync function in event loop: {self.fn}")
-    #             result = asyncio.to_thread(self.call, *args, **kwargs)
-    #         else:
-    #             result = self.call(*args, **kwargs)
+        No matter of the function type, you can run the function using both asyncio and without asyncio.
+        Inside a running event loop, an awaitable is returned; otherwise the ``FunctionOutput``.
+
+        Use it with caution as it might block the event loop.
+
+        Note:
+            Inside a running event loop, sync functions run on a shared thread pool and
+            context variables are not propagated to them. Use ``asyncio.to_thread(tool.call, ...)``
+            if the function depends on them.
+
+        Example:
+
+        .. code-block:: python
 
-    #     return result
+            import asyncio
+            import time
+
+            async def async_function_1():
+                await asyncio.sleep(1)
+                return "Function 1 completed"
+
+            def sync_function_1():
+                time.sleep(1)
+                return "Function 1 completed"
+
+            async def async_function_2():
+                await asyncio.sleep(2)
+                return "Function 2 completed"
+
+            def sync_function_2():
+                time.sleep(2)
+                return "Function 2 completed"
+
+            async_tool_1 = FunctionTool(async_function_1)
+            sync_tool_1 = FunctionTool(sync_function_2)
+            async_tool_2 = FunctionTool(async_function_2)
+            sync_tool_2 = FunctionTool(sync_function_2)
+
+            def run_sync_and_async_mix_without_wait():
+                # both sync and async tool can use execute
+                # sync tool can also use call
+                # takes 5 seconds (1+1+2) + overhead
+                start_time = time.time()
+                results = [
+                    async_tool_1.execute(),
+                    sync_tool_1.execute(),
+                    sync_tool_2.call(),
+                ]
+                end_time = time.time()
+                print(f"run_sync_and_async_mix_without_wait time: {end_time - start_time}")
+                return results
+
+            async def run_sync_and_async_mix():
+                # both sync and async tool can use execute&to_thread
+                # async tool can also use acall without to_thread
+                # takes a bit over 2 seconds max(2)
+                start_time = time.time()
+                results = await asyncio.gather(
+                    async_tool_1.execute(),
+                    sync_tool_1.execute(),
+                    async_tool_2.acall(),
+                )
+                end_time = time.time()
+                print(f"run_sync_and_async_mix time: {end_time - start_time}")
+                return results
+
+            run_sync_and_async_mix_without_wait()
+            asyncio.run(run_sync_and_async_mix())
+        """
+        if self._is_async:
+            log.debug("Running async function: %s", self.fn)
+            if is_running_in_event_loop():
+                result = asyncio.create_task(self.acall(*args, **kwargs))
+            else:
+                result = _background_runtime.run_sync(self.acall(*args, **kwargs))
+        # NOTE: in juptyer notebook, it is always running in event loop
+        else:
+            log.debug("Running sync function: %s", self.fn)
+            if is_running_in_event_loop():
+                result = _background_runtime.run_in_executor(self.call, *args, **kwargs)
+            else:
+                result = self.call(*args, **kwargs)
+
+        return result
+
+    def warmup(self, *args: Any, **kwargs: Any) -> None:
+        r"""Trigger the numba jit compilation (cached on disk) so that the first real call does not pay for it.
+
+        Runs the function once with the example arguments and discards the result. A no-op unless the tool
+        was created with ``numba=True``.
+        """
+        if not self._numba:
+            return
+        self.fn(*args, **kwargs)
 
+    # NOTE: __call__ is inherited from Component and dispatches straight to bicall, which
+    # keeps the training/inference output checks. Routing it through execute would add the
+    # async/event-loop branching to every call and return an awaitable inside a loop.
     # def __call__(self, *args, **kwargs) -> FunctionOutput:
     #     r"""Execute the function synchronously or asynchronously based on the function type."""
     #     return self.execute(*args, **kwargs)
@@ -28,7 +28,7 @@ import ast
 import threading
 import base64
 
-from inspect import signature, Parameter
+from inspect import signature, Parameter, Signature
 from dataclasses import fields, is_dataclass, MISSING, Field
 
 from pydantic import BaseModel
@@ -573,10 +573,14 @@ def convert_schema_to_signature(schema: Dict[str, Dict[str, Any]]) -> Dict[str,
 # For FunctionTool component
 # It uses get_type_schema and get_dataclass_schema to generate the schema of arguments.
 ########################################################################################
-def get_fun_schema(name: str, func: Callable[..., object]) -> Dict[str, object]:
+def get_fun_schema(
+    name: str, func: Callable[..., object], sig: Optional[Signature] = None
+) -> Dict[str, object]:
     r"""Get the schema of a function.
     Support dataclass, Union and normal data types such as int, str, float, etc, list, dict, set.
 
+    Pass ``sig`` if the signature of ``func`` is already computed to avoid inspecting it again.
+
     Examples:
     def example_function(x: int, y: str = "default") -> int:
         return x
@@ -599,7 +603,8 @@ def get_fun_schema(name: str, func: Callable[..., object]) -> Dict[str, object]:
         ]
     }
     """
-    sig = signature(func)
+    if sig is None:
+        sig = signature(func)
     schema = {"type": "object", "properties": {}, "required": []}
     type_hints = get_type_hints(func)
 
@@ -950,6 +955,20 @@ def generate_readable_key_for_function(fn: Callable) -> str:
 ########################################################################################
 # For Parser components
 ########################################################################################
+# compiled once at import: the parsers run on every generator output
+_FIRST_INT_RE = re.compile(r"\b\d+\b")
+_FIRST_FLOAT_RE = re.compile(r"\b\d+(\.\d+)?\b")
+_FIRST_BOOLEAN_RE = re.compile(r"\b(?:true|false|True|False)\b")
+_JSON_TRAILING_FENCE_RE = re.compile(r"^(.*?)\n?```\}*$", re.MULTILINE | re.DOTALL)
+_JSON_MARKDOWN_RE = re.compile(
+    r"^```(?:json|JSON)?\s*\n?(.*?)```", re.MULTILINE | re.DOTALL
+)
+_YAML_MARKDOWN_RE = re.compile(
+    r"^```(?:ya?ml)?(?P<yaml>[^`]*)", re.MULTILINE | re.DOTALL
+)
+_JSON_MISSING_COMMA_RE = re.compile(r'(?<=[}\]"\'\d])(\s+)(?=[\{"\[])')
+
+
 def extract_first_int(text: str) -> int:
     """Extract the first integer from the provided text.
 
@@ -962,7 +981,7 @@ def extract_first_int(text: str) -> int:
     Raises:
         ValueError: If no integer is found in the text.
     """
-    match = re.search(r"\b\d+\b", text)
+    match = _FIRST_INT_RE.search(text)
     if match:
         return int(match.group())
     raise ValueError("No integer found in the text.")
@@ -980,7 +999,7 @@ def extract_first_float(text: str) -> float:
     Raises:
         ValueError: If no float is found in the text.
     """
-    match = re.search(r"\b\d+(\.\d+)?\b", text)
+    match = _FIRST_FLOAT_RE.search(text)
 
     if match:
         return float(match.group())
@@ -999,7 +1018,7 @@ def extract_first_boolean(text: str) -> bool:
     Raises:
         ValueError: If no boolean is found in the text.
     """
-    match = re.search(r"\b(?:true|false|True|False)\b", text)
+    match = _FIRST_BOOLEAN_RE.search(text)
     if match:
         return match.group().lower() == "true"
     raise ValueError("No boolean found in the text.")
@@ -1096,11 +1115,9 @@ def extract_json_str(text: str, add_missing_right_brace: bool = True) -> str:
     
     # First, handle the specific case where JSON ends with ```} or similar patterns
     # This regex will capture JSON that might have trailing markdown artifacts
-    malformed_pattern = re.compile(
-        r'^(.*?)\n?```\}*$', re.MULTILINE | re.DOTALL
-    )
-    malformed_match = malformed_pattern.match(text)
-    if malformed_match and text.endswith('```}'):
+    # endswith first: it is the rare case, and it spares the lazy DOTALL scan
+    malformed_match = text.endswith("```}") and _JSON_TRAILING_FENCE_RE.match(text)
+    if malformed_match:
         # Extract just the JSON part before the markdown artifacts
         potential_json = malformed_match.group(1).strip()
         # Validate using helper function
@@ -1111,10 +1128,7 @@ def extract_json_str(text: str, add_missing_right_brace: bool = True) -> str:
     # Pattern matches ```json, ```JSON, or just ``` at the start
     # IMPORTANT: Only extract if the text STARTS with markdown code blocks to avoid
     # extracting embedded code blocks within JSON string values
-    json_markdown_pattern = re.compile(
-        r"^```(?:json|JSON)?\s*\n?(.*?)```", re.MULTILINE | re.DOTALL
-    )
-    match = json_markdown_pattern.match(text)  # Use match instead of search to ensure it starts at beginning
+    match = _JSON_MARKDOWN_RE.match(text)  # Use match instead of search to ensure it starts at beginning
     if match:
         # Extract the JSON content from within the code blocks
         json_content = match.group(1).strip()
@@ -1230,10 +1244,7 @@ def extract_yaml_str(text: str) -> str:
         ValueError: If no YAML string is found in the text.
     """
     try:
-        yaml_re_pattern: re.Pattern = re.compile(
-            r"^```(?:ya?ml)?(?P<yaml>[^`]*)", re.MULTILINE | re.DOTALL
-        )
-        match = yaml_re_pattern.search(text.strip())
+        match = _YAML_MARKDOWN_RE.search(text.strip())
 
         yaml_str = ""
         if match:
@@ -1247,11 +1258,8 @@ def extract_yaml_str(text: str) -> str:
 
 def fix_json_missing_commas(json_str: str) -> str:
     # Example: adding missing commas, only after double quotes
-    # Regular expression to find missing commas
-    regex = r'(?<=[}\]"\'\d])(\s+)(?=[\{"\[])'
-
     # Add commas where missing
-    fixed_json_str = re.sub(regex, r",\1", json_str)
+    fixed_json_str = _JSON_MISSING_COMMA_RE.sub(r",\1", json_str)
 
     return fixed_json_str
 
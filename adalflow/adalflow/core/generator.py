@@ -63,6 +63,10 @@ log = logging.getLogger(__name__)
 
 PromptArgType = Dict[str, Union[str, Parameter]]
 
+# demo data classes keyed by field names/types and input/output field split, so
+# make_dataclass (~1ms of codegen) runs once per schema instead of per sample
+_DEMO_DATA_CLASSES: Dict[Tuple, type] = {}
+
 
 @dataclass
 class BackwardPassSetup(DataClass):
@@ -574,7 +578,17 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         for key, value in demo_data_class_output_mapping.items():
             demo_data[key] = value(output)
 
-        obj = DynamicDataClassFactory.from_dict(demo_data)
+        class_key = (
+            tuple((k, type(v)) for k, v in demo_data.items()),
+            tuple(input_prompt_kwargs.keys()),
+            tuple(output_fields),
+        )
+        demo_class = _DEMO_DATA_CLASSES.get(class_key)
+        if demo_class is not None:
+            obj = demo_class.from_dict(demo_data)
+        else:
+            obj = DynamicDataClassFactory.from_dict(demo_data)
+            _DEMO_DATA_CLASSES[class_key] = type(obj)
         obj.set_input_fields([k for k in input_prompt_kwargs.keys()])
         obj.set_output_fields(output_fields)
         if obj is None:
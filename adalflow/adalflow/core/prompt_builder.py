@@ -78,9 +78,7 @@ class Prompt(DataComponent):
     def __create_jinja2_template(self):
         r"""Create the Jinja2 template object."""
         try:
-            self.jinja2_template: Template = get_jinja2_environment().from_string(
-                self.template
-            )
+            self.jinja2_template: Template = _compile_jinja2_template(self.template)
         except Exception as e:
             raise ValueError(f"Invalid Jinja2 template: {e}")
 
@@ -98,8 +96,7 @@ class Prompt(DataComponent):
 
     def _find_template_variables(self, template_str: str):
         """Automatically find all the variables in the template."""
-        parsed_content = self.jinja2_template.environment.parse(template_str)
-        return meta.find_undeclared_variables(parsed_content)
+        return _find_jinja2_template_variables(template_str)
 
     def compose_prompt_kwargs(self, **kwargs) -> Dict:
         r"""Compose the final prompt kwargs by combining the initial and the provided kwargs at runtime."""
@@ -215,7 +212,7 @@ class Prompt(DataComponent):
     def from_dict(cls: type[T], data: Dict[str, Any]) -> T:
         obj = super().from_dict(data)
         # recreate the jinja2 template
-        obj.jinja2_template = get_jinja2_environment().from_string(obj.template)
+        obj.jinja2_template = _compile_jinja2_template(obj.template)
         return obj
 
     def to_dict(self) -> Dict[str, Any]:
@@ -274,6 +271,19 @@ def get_jinja2_environment():
         raise ValueError(f"Invalid Jinja2 environment: {e}")
 
 
+# Generator.get_prompt builds a new Prompt on every planner call, so compiling and parsing the
+# template string is cached instead of redone per render. Compiled templates are immutable.
+@lru_cache(maxsize=128)
+def _compile_jinja2_template(template: str) -> Template:
+    return get_jinja2_environment().from_string(template)
+
+
+@lru_cache(maxsize=128)
+def _find_jinja2_template_variables(template: str) -> frozenset:
+    parsed_content = get_jinja2_environment().parse(template)
+    return frozenset(meta.find_undeclared_variables(parsed_content))
+
+
 if __name__ == "__main__":
 
     import adalflow as adal
@@ -18,7 +18,6 @@ import logging
 from copy import deepcopy
 import asyncio
 from adalflow.optim.parameter import Parameter, ParameterType
-import nest_asyncio
 import warnings
 
 from adalflow.core.container import ComponentList
@@ -149,7 +148,6 @@ class ToolManager(Component):
         ] = {},  # anything besides the tools
     ):
         super().__init__()
-        nest_asyncio.apply()  # Apply nest_asyncio to handle nested loops
         processed_tools = [
             (
                 FunctionTool(fn=deepcopy(tool))
@@ -194,14 +192,14 @@ class ToolManager(Component):
     def yaml_definitions(self) -> List[str]:
         output = []
         for tool in self.tools:
-            output.append(tool.definition.to_yaml())
+            output.append(tool.definition_yaml)
         return output
 
     @property
     def json_definitions(self) -> List[str]:
         output = []
         for tool in self.tools:
-            output.append(tool.definition.to_json())
+            output.append(tool.definition_json)
         return output
 
     @property
@@ -313,7 +311,11 @@ class ToolManager(Component):
         map_fn: Callable = lambda x: x.data,
         stream: bool = False,
     ) -> Union[FunctionOutput, Parameter]:
-        r"""Execute the function synchronously"""
+        r"""Execute the function synchronously.
+
+        A :class:`Function` always yields a :class:`FunctionOutput`; any failure, including a tool that does not
+        return one, is raised as ``ValueError``.
+        """
 
         if isinstance(func, Parameter):
             try:
@@ -330,18 +332,17 @@ class ToolManager(Component):
         else:
             try:
                 tool: FunctionTool = self.context[func.name]
-                log.debug(f"tool: {tool}")
+                log.debug("tool: %s", tool)
 
                 output = None
 
                 if stream:
-                    # add stream = True to the kwargs
-                    use_func_kwargs = deepcopy(func.kwargs)
-                    use_func_kwargs["stream"] = True
-                    output = tool.call(*func.args, **use_func_kwargs)
+                    # add stream = True to the kwargs, a shallow copy is enough as
+                    # only a top-level key is added
+                    output = tool.call(*func.args, **{**func.kwargs, "stream": True})
                 else:
                     output = tool.call(*func.args, **func.kwargs)
-                    log.debug(f"output: {output}")
+                    log.debug("output: %s", output)
                 if not isinstance(output, FunctionOutput):
                     raise ValueError(f"Output should be FunctionOutput. Got {output}")
                 return output
@@ -426,7 +427,11 @@ class ToolManager(Component):
     #             raise ValueError(f"Error {e} executing function: {func}")
 
     async def execute_func_async(self, func: Function) -> FunctionOutput:
-        r"""Execute the function. If the function is sync, use await to execute it."""
+        r"""Execute the function. If the function is sync, use await to execute it.
+
+        Always returns a :class:`FunctionOutput`; any failure, including a tool that does not
+        return one, is raised as ``ValueError``.
+        """
         try:
             log.debug(f"Executing async function: {func.name}")
             tool: FunctionTool = self.context[func.name]
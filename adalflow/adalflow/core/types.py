@@ -1555,6 +1555,11 @@ class EventEncoder(json.JSONEncoder):
             return super().default(obj)
 
 
+# RunnerStreamingResult.aput waits for the consumer once this many events are queued,
+# and resumes when the consumer has caught up to half of it
+_STREAM_QUEUE_HIGH_WATER_MARK = 1024
+
+
 @dataclass
 class RunnerStreamingResult:
     """
@@ -1564,10 +1569,20 @@ class RunnerStreamingResult:
 
     _event_queue: asyncio.Queue = field(default_factory=asyncio.Queue)
     _run_task: Optional[asyncio.Task] = field(default=None)
+    # starts _run_task on the consumer's loop when astream was called outside of a running loop
+    _start_run: Optional[Callable[[], asyncio.Task]] = field(default=None)
     _exception: Optional[Exception] = field(default=None)
     answer: Optional[Any] = field(default=None)
     step_history: List[Any] = field(default_factory=list)
     _is_complete: bool = field(default=False)
+    # set while stream_events is being iterated, aput only waits for an active consumer
+    _consuming: bool = field(default=False)
+    _queue_drained: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def _ensure_started(self) -> None:
+        if self._run_task is None and self._start_run is not None:
+            start_run, self._start_run = self._start_run, None
+            self._run_task = start_run()
 
     @property
     def is_complete(self) -> bool:
@@ -1595,6 +1610,20 @@ class RunnerStreamingResult:
 
         self._event_queue.put_nowait(item)
 
+    async def aput(self, item: StreamEvent):
+        """Put an item into the queue, waiting while the consumer of :meth:`stream_events`
+        is far behind so that high-volume events (raw response chunks) cannot pile up.
+
+        Never waits when nobody iterates the events, e.g. when only :meth:`wait_for_completion` is awaited.
+        """
+        self.put_nowait(item)
+        if (
+            self._consuming
+            and self._event_queue.qsize() >= _STREAM_QUEUE_HIGH_WATER_MARK
+        ):
+            self._queue_drained.clear()
+            await self._queue_drained.wait()
+
     async def stream_events(self) -> AsyncIterator[StreamEvent]:
         """
         Stream events from the runner execution.w
@@ -1612,43 +1641,52 @@ class RunnerStreamingResult:
                     print(f"Run item: {event.name} - {event.item}")
             ```
         """
-        while True:
-            if self._exception:
-                # Ensure we're raising a proper exception
-                if isinstance(self._exception, BaseException):
-                    raise self._exception
-                else:
-                    # Convert non-exception to a proper exception
-                    raise RuntimeError(str(self._exception))
-
-            try:
-                # Wait for an event from the queue
-                event = await self._event_queue.get()
+        self._ensure_started()
+        self._consuming = True
+        try:
+            while True:
+                if self._exception:
+                    # Ensure we're raising a proper exception
+                    if isinstance(self._exception, BaseException):
+                        raise self._exception
+                    else:
+                        # Convert non-exception to a proper exception
+                        raise RuntimeError(str(self._exception))
 
-                # Check for completion sentinel or special completion events
-                if isinstance(event, QueueCompleteSentinel):
-                    self._event_queue.task_done()
-                    break
-                else:
-                    # always yield event
-                    yield event
-                    # mark the task as done
-                    self._event_queue.task_done()
-                    # if the event is a RunItemStreamEvent and the name is agent.execution_complete then additionally break the loop
-                    if (
-                        isinstance(event, RunItemStreamEvent)
-                        and event.name == "agent.execution_complete"
-                    ):
+                try:
+                    # Wait for an event from the queue
+                    event = await self._event_queue.get()
+                    if self._event_queue.qsize() <= _STREAM_QUEUE_HIGH_WATER_MARK // 2:
+                        self._queue_drained.set()
+
+                    # Check for completion sentinel or special completion events
+                    if isinstance(event, QueueCompleteSentinel):
+                        self._event_queue.task_done()
                         break
-
-            except asyncio.CancelledError:
-                # Clean up and re-raise to allow proper cancellation
-                self._is_complete = True
-                raise
-            except Exception as e:
-                # Store unexpected exceptions
-                self.set_exception(e)
-                raise
+                    else:
+                        # always yield event
+                        yield event
+                        # mark the task as done
+                        self._event_queue.task_done()
+                        # if the event is a RunItemStreamEvent and the name is agent.execution_complete then additionally break the loop
+                        if (
+                            isinstance(event, RunItemStreamEvent)
+                            and event.name == "agent.execution_complete"
+                        ):
+                            break
+
+                except asyncio.CancelledError:
+                    # Clean up and re-raise to allow proper cancellation
+                    self._is_complete = True
+                    raise
+                except Exception as e:
+                    # Store unexpected exceptions
+                    self.set_exception(e)
+                    raise
+        finally:
+            # release a producer waiting in aput, nobody is going to drain the queue anymore
+            self._consuming = False
+            self._queue_drained.set()
 
     async def stream_to_json(
         self, file_name: str = "agent_events_stream.json"
@@ -1779,10 +1817,12 @@ class RunnerStreamingResult:
 
     def cancel(self):
         """Cancel the running task."""
+        self._start_run = None
         if self._run_task and not self._run_task.done():
             self._run_task.cancel()
 
     async def wait_for_completion(self):
         """Wait for the runner task to complete."""
+        self._ensure_started()
         if self._run_task:
             await self._run_task
@@ -5,17 +5,20 @@ import string
 from collections import Counter
 
 
+_ARTICLES_RE = re.compile(r"\b(a|an|the)\b")
+_REMOVE_PUNC_TABLE = str.maketrans("", "", string.punctuation)
+
+
 def normalize_answer(s):
 
     def remove_articles(text):
-        return re.sub(r"\b(a|an|the)\b", " ", text)
+        return _ARTICLES_RE.sub(" ", text)
 
     def white_space_fix(text):
         return " ".join(text.split())
 
     def remove_punc(text):
-        exclude = set(string.punctuation)
-        return "".join(ch for ch in text if ch not in exclude)
+        return text.translate(_REMOVE_PUNC_TABLE)
 
     def lower(text):
         return text.lower()
@@ -17,7 +17,6 @@ from adalflow.optim.parameter import (
 from adalflow.optim.gradient import Gradient, GradientContext
 from adalflow.optim.types import ParameterType
 from adalflow.core.types import GeneratorOutput
-from adalflow.utils import printc
 
 import json
 
@@ -252,16 +251,19 @@ class GradComponent(Component):
         log.info(f"GradComponent backward: {response.name}")
         children_params = response.predecessors
 
-        if response.get_gradient_and_context_text().strip() == "":
+        # the gradient text is only empty without gradients; skip rendering it
+        if not response.gradients:
             log.info(f"Generator: Backward: No gradient found for {response}.")
 
+        score = response.score
+        teacher_mode = self.teacher_mode
         for _, pred in enumerate(children_params):
-            if response.score is not None:
-                pred.set_score(response.score)
+            if score is not None:
+                pred.set_score(score)
 
             if pred.param_type == ParameterType.DEMOS:
                 pred.add_score_to_trace(
-                    trace_id=id, score=response.score, is_teacher=self.teacher_mode
+                    trace_id=id, score=score, is_teacher=teacher_mode
                 )
             for grad in response.gradients:
                 # NOTE: make a copy of the gradient, we should not modify the original gradient
@@ -342,7 +344,7 @@ class GradComponent(Component):
         obj_ins_template = OBJECTIVE_INSTRUCTION_BASE
 
         if is_intermediate_node:
-            printc(f"is_intermediate_node: {is_intermediate_node}")
+            log.debug("is_intermediate_node: %s", is_intermediate_node)
             # conv_ins_template = CONVERSATION_START_INSTRUCTION_STRING_FN_CHAIN
             obj_ins_template = OBJECTIVE_INSTRUCTION_CHAIN
 
@@ -445,7 +447,7 @@ class GradComponent(Component):
             log.info("EvalFnToTextLoss is an intermediate node.")
             is_intermediate_node = True
 
-        if response.get_gradient_and_context_text().strip() == "":
+        if not is_intermediate_node:
             log.info(f"Generator: Backward: No gradient found for {response}.")
 
         # use pass through gradient when there is one predecessor
@@ -454,19 +456,21 @@ class GradComponent(Component):
 
         else:
 
+            score = response.score
+            teacher_mode = self.teacher_mode
             for _, pred in enumerate(children_params):
-                if response.score is not None:
-                    pred.set_score(response.score)
-                printc(f"score {response.score} for pred name: {pred.name}")
+                if score is not None:
+                    pred.set_score(score)
+                log.debug("score %s for pred name: %s", score, pred.name)
                 if not pred.requires_opt:
                     continue
 
                 if pred.param_type == ParameterType.DEMOS:
                     pred.add_score_to_trace(
-                        trace_id=id, score=response.score, is_teacher=self.teacher_mode
+                        trace_id=id, score=score, is_teacher=teacher_mode
                     )
 
-                printc(f"pred: {pred.name}, response: {response.name}")
+                log.debug("pred: %s, response: %s", pred.name, response.name)
 
                 self._backward_through_one_predecessor(
                     pred=pred,
@@ -105,6 +105,10 @@ class OptionalPackages(Enum):
         "qdrant-client",
         "Please install qdrant-client with: pip install qdrant-client",
     )
+    # async runtime
+    UVLOOP = ("uvloop", "Please install uvloop with: pip install uvloop")
+    # jit
+    NUMBA = ("numba", "Please install numba with: pip install numba")
 
     def __init__(self, package_name, error_message):
         self.package_name = package_name
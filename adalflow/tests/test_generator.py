@@ -137,6 +137,20 @@ class TestGenerator(IsolatedAsyncioTestCase):
         # )
         self._clean_up()
 
+    def test_create_demo_data_instance_reuses_class(self):
+        first = self.generator.create_demo_data_instance(
+            {"question": "q1"}, GeneratorOutput(raw_response="a1"), id="1"
+        )
+        second = self.generator.create_demo_data_instance(
+            {"question": "q2"}, GeneratorOutput(raw_response="a2"), id="2"
+        )
+        self.assertIs(type(first), type(second))
+        self.assertEqual(first.question, "q1")
+        self.assertEqual(second.question, "q2")
+        self.assertEqual(second.Example, "a2")
+        self.assertEqual(second.get_input_fields(), ["question"])
+        self.assertEqual(second.get_output_fields(), ["Answer"])
+
 
 def getenv_side_effect(key):
     # This dictionary can hold more keys and values as needed
@@ -175,6 +175,194 @@ class TestRunner(unittest.TestCase):
         self.assertTrue(self.runner._check_last_step(answer_output_fn))
         self.assertFalse(self.runner._check_last_step(cont_fn))
 
+    def test_use_uvloop(self):
+        uvloop_runner_script = """
+import asyncio
+from adalflow.components.agent.agent import Agent
+from adalflow.components.agent.runner import Runner
+from adalflow.core.types import Function, GeneratorOutput
+from tests.test_runner import DummyFunction, FakePlanner
+
+async def async_add(x: int, y: int) -> int:
+    "Add two numbers."
+    return x + y
+
+async def call_sync_in_loop():
+    return agent.tool_manager.tools[0].call(1, 2).output
+
+def build_agent():
+    steps = [
+        Function(name="async_add", kwargs={{"x": 1, "y": 2}}),
+        DummyFunction(name="answer_output", _is_answer_final=True, _answer="done"),
+    ]
+    planner = FakePlanner([GeneratorOutput(data=step) for step in steps])
+    # the real Agent builds a real ToolManager
+    return Agent(name="agent", tools=[async_add], planner=planner)
+
+async def main():
+    result = await runner.acall(prompt_kwargs={{}})
+    is_uvloop = type(asyncio.get_running_loop()).__module__.startswith("uvloop")
+    return is_uvloop, result.step_history[0].observation, result.answer
+
+{setup}
+print(*asyncio.run(main()))
+"""
+        try:
+            import uvloop  # noqa: F401
+        except ImportError:
+            self.skipTest("uvloop is not installed")
+        import os
+        import subprocess
+        import sys
+
+        import adalflow
+
+        package_root = os.path.dirname(os.path.dirname(adalflow.__file__))
+        env = {**os.environ, "PYTHONPATH": package_root, "ADALFLOW_USE_UVLOOP": ""}
+        cases = {
+            "agent = build_agent()\nrunner = Runner(agent=agent, use_uvloop=True)": "True 3 done",
+            # a sync call of an async tool inside a running loop applies nest_asyncio
+            "agent = build_agent()\nasyncio.run(call_sync_in_loop())\n"
+            "runner = Runner(agent=agent, use_uvloop=True)": "False 3 done",
+        }
+        for setup, expected in cases.items():
+            with self.subTest(setup=setup):
+                result = subprocess.run(
+                    [sys.executable, "-c", uvloop_runner_script.format(setup=setup)],
+                    capture_output=True,
+                    text=True,
+                    timeout=60,
+                    cwd=package_root,
+                    env=env,
+                )
+                self.assertEqual(result.returncode, 0, result.stderr)
+                # importing tests.test_runner also configures console logging
+                self.assertEqual(result.stdout.strip().splitlines()[-1], expected)
+
+    def _assert_stream_tool_execution_interleaves(self, tool_generator):
+        """``tool_generator(order)`` yields an activity, appends "tool_resumed" to ``order``, then yields "final"."""
+        from adalflow.core.types import RunnerStreamingResult
+
+        order = []
+        generator = tool_generator(order)
+        runner = Runner(
+            agent=DummyAgent(
+                planner=None,
+                answer_data_type=None,
+                tool_manager=MockToolManager(lambda func, step: generator),
+            )
+        )
+
+        async def run():
+            streaming_result = RunnerStreamingResult()
+
+            async def consume():
+                event = await streaming_result._event_queue.get()
+                while event.name != "agent.tool_call_activity":
+                    event = await streaming_result._event_queue.get()
+                order.append("activity_received")
+
+            consumer = asyncio.create_task(consume())
+            await asyncio.sleep(0)
+            fn = DummyFunction(name="tool")
+            fn.id = "call-1"
+            result = await runner.stream_tool_execution(
+                function=fn,
+                tool_call_id="call-1",
+                tool_call_name="tool",
+                streaming_result=streaming_result,
+            )
+            await consumer
+            return result
+
+        _, output, _ = asyncio.run(run())
+        self.assertEqual(output, "final")
+        self.assertEqual(order, ["activity_received", "tool_resumed"])
+
+    def test_stream_tool_execution_sync_generator_interleaves_activities(self):
+        from adalflow.core.types import ToolCallActivityRunItem
+
+        def sync_tool_generator(order):
+            yield ToolCallActivityRunItem(data="working")
+            order.append("tool_resumed")
+            yield "final"
+
+        self._assert_stream_tool_execution_interleaves(sync_tool_generator)
+
+    def test_stream_tool_execution_async_generator_interleaves_activities(self):
+        from adalflow.core.types import ToolCallActivityRunItem
+
+        async def async_tool_generator(order):
+            # no await between the yields: the tool itself never suspends
+            yield ToolCallActivityRunItem(data="working")
+            order.append("tool_resumed")
+            yield "final"
+
+        self._assert_stream_tool_execution_interleaves(async_tool_generator)
+
+    def test_streaming_result_aput_waits_for_lagging_consumer(self):
+        from adalflow.core.types import QueueCompleteSentinel, RunnerStreamingResult
+
+        async def run():
+            streaming_result = RunnerStreamingResult()
+            max_queued = 0
+
+            async def produce():
+                nonlocal max_queued
+                for i in range(50):
+                    await streaming_result.aput(RawResponsesStreamEvent(data=i))
+                    max_queued = max(max_queued, streaming_result._event_queue.qsize())
+                streaming_result.put_nowait(QueueCompleteSentinel())
+
+            producer = asyncio.create_task(produce())
+            received = []
+            async for event in streaming_result.stream_events():
+                received.append(event.data)
+                await asyncio.sleep(0)
+            await producer
+            return received, max_queued
+
+        with unittest.mock.patch(
+            "adalflow.core.types._STREAM_QUEUE_HIGH_WATER_MARK", 8
+        ):
+            received, max_queued = asyncio.run(run())
+
+        self.assertEqual(received, list(range(50)))
+        self.assertLessEqual(max_queued, 8)
+
+    def test_streaming_result_aput_without_consumer_does_not_wait(self):
+        from adalflow.core.types import RunnerStreamingResult
+
+        async def run():
+            streaming_result = RunnerStreamingResult()
+            for i in range(20):
+                await streaming_result.aput(RawResponsesStreamEvent(data=i))
+            return streaming_result._event_queue.qsize()
+
+        with unittest.mock.patch(
+            "adalflow.core.types._STREAM_QUEUE_HIGH_WATER_MARK", 8
+        ):
+            self.assertEqual(asyncio.run(asyncio.wait_for(run(), timeout=5)), 20)
+
+    def test_astream_outside_running_loop_starts_on_consumer_loop(self):
+        fn = DummyFunction(name="answer_output", _is_answer_final=True, _answer="done")
+        runner = Runner(
+            agent=DummyAgent(
+                planner=FakePlanner([GeneratorOutput(data=fn)]), answer_data_type=None
+            )
+        )
+
+        # called from sync code, e.g. a worker thread without an event loop
+        stream_result = runner.astream(prompt_kwargs={})
+        self.assertIsNone(stream_result._run_task)
+
+        async def consume():
+            return [event async for event in stream_result.stream_events()]
+
+        events = asyncio.run(consume())
+        self.assertEqual(events[-1].name, "agent.execution_complete")
+        self.assertEqual(stream_result.answer, "done")
+
     def test_call_single_step_answer_output_returns_runner_response(self):
         fn = DummyFunction(name="answer_output", _is_answer_final=True, _answer="done")
         # Create a mock tool manager that returns a FunctionOutput
@@ -1082,6 +1270,101 @@ class TestRunnerBugFixes(unittest.TestCase):
             runner._process_data('"just a string"')
         self.assertIn("Expected dict after JSON parsing", str(cm.exception))
 
+        # Valid JSON string and an already parsed dict give the same model
+        self.assertEqual(runner._process_data('{"value": "ok"}'), TestModel(value="ok"))
+        self.assertEqual(runner._process_data({"value": "ok"}), TestModel(value="ok"))
+
+    def test_acall_large_json_answer_validated_in_thread(self):
+        from pydantic import BaseModel
+
+        class TestModel(BaseModel):
+            value: str
+
+        long_value = "x" * 5000
+        fn = DummyFunction(
+            name="answer_output",
+            _is_answer_final=True,
+            _answer='{"value": "%s"}' % long_value,
+        )
+        runner = Runner(
+            agent=DummyAgent(
+                planner=FakePlanner([GeneratorOutput(data=fn)]),
+                answer_data_type=TestModel,
+            ),
+        )
+
+        with unittest.mock.patch(
+            "asyncio.to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            result = asyncio.run(runner.acall(prompt_kwargs={}))
+
+        self.assertEqual(result.answer, TestModel(value=long_value))
+        to_thread.assert_called_once()
+
+    def test_acall_builds_deferred_validator_during_planner_call(self):
+        from pydantic import BaseModel, ConfigDict
+
+        from adalflow.components.agent import runner as runner_module
+
+        class DeferredModel(BaseModel):
+            model_config = ConfigDict(defer_build=True)
+            value: str
+
+        def build_runner():
+            fn = DummyFunction(
+                name="answer_output", _is_answer_final=True, _answer='{"value": "done"}'
+            )
+            return Runner(
+                agent=DummyAgent(
+                    planner=FakePlanner([GeneratorOutput(data=fn)]),
+                    answer_data_type=DeferredModel,
+                ),
+            )
+
+        async def run_concurrently():
+            return await asyncio.gather(
+                build_runner().acall(prompt_kwargs={}),
+                build_runner().acall(prompt_kwargs={}),
+            )
+
+        self.assertFalse(DeferredModel.__pydantic_complete__)
+
+        with unittest.mock.patch.object(
+            runner_module._background_runtime,
+            "submit_blocking",
+            wraps=runner_module._background_runtime.submit_blocking,
+        ) as submit_blocking:
+            results = asyncio.run(run_concurrently())
+
+        self.assertEqual(
+            [result.answer for result in results], [DeferredModel(value="done")] * 2
+        )
+        self.assertTrue(DeferredModel.__pydantic_complete__)
+        # the concurrent runs share one build, released once both are done
+        submit_blocking.assert_called_once()
+        self.assertNotIn(DeferredModel, runner_module._VALIDATOR_BUILDS)
+
+    def test_acall_releases_deferred_validator_build_without_final_step(self):
+        from pydantic import BaseModel, ConfigDict
+
+        from adalflow.components.agent import runner as runner_module
+
+        class DeferredModel(BaseModel):
+            model_config = ConfigDict(defer_build=True)
+            value: str
+
+        runner = Runner(
+            agent=DummyAgent(
+                planner=FakePlanner([None] * 3),
+                answer_data_type=DeferredModel,
+            ),
+            max_steps=3,
+        )
+        result = asyncio.run(runner.acall(prompt_kwargs={}))
+
+        self.assertIn("max_steps", result.answer)
+        # no run holds the build any more, it is dropped (and cancelled if it has not started)
+        self.assertNotIn(DeferredModel, runner_module._VALIDATOR_BUILDS)
 
 if __name__ == "__main__":
     unittest.main()
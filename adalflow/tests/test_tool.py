@@ -1,7 +1,9 @@
 import pytest
 import inspect
 import asyncio
+import threading
 import time
+import warnings
 from dataclasses import dataclass
 
 from adalflow.core.func_tool import FunctionTool, FunctionType
@@ -73,6 +75,280 @@ def test_function_tool_async():
     assert output.input.args == (3, 4)
 
 
+def test_function_tool_definition_cached_per_fn():
+    tool_1 = FunctionTool(fn=sync_add)
+    tool_2 = FunctionTool(fn=sync_add)
+    assert tool_1.definition == tool_2.definition
+    assert tool_1.definition.func_name == "sync_add"
+
+    # each tool owns its copy of the cached definition
+    assert tool_1.definition is not tool_2.definition
+    tool_1.definition.func_desc = "changed"
+    tool_1.definition.func_parameters["properties"]["x"]["description"] = "changed"
+    for tool in (tool_2, FunctionTool(fn=sync_add)):
+        assert tool.definition.func_desc != "changed"
+        assert "description" not in tool.definition.func_parameters["properties"]["x"]
+
+    # an explicit definition is never replaced by the cached one
+    tool_3 = FunctionTool(definition=metadata, fn=sync_add)
+    assert tool_3.definition is metadata
+
+
+def test_function_tool_async_call_reuses_background_loop():
+    loops = []
+
+    async def record_loop(x):
+        loops.append(asyncio.get_running_loop())
+        return x
+
+    tool = FunctionTool(fn=record_loop)
+    assert tool.call(1).output == 1
+    assert tool.call(2).output == 2
+    assert loops[0] is loops[1]
+    assert not loops[0].is_closed()
+
+
+def test_function_tool_execute_many():
+    # every call waits until all three are running, so run one after another they would time out
+    barrier = threading.Barrier(3, timeout=10)
+
+    def wait_sync(x):
+        barrier.wait()
+        return x
+
+    async def wait_async(x):
+        await asyncio.to_thread(barrier.wait)
+        return x
+
+    sync_tool = FunctionTool(fn=wait_sync)
+    async_tool = FunctionTool(fn=wait_async)
+
+    futures = FunctionTool.execute_many(
+        [
+            (sync_tool, (1,), {}),
+            (sync_tool, (), {"x": 2}),
+            (async_tool, (3,), {}),
+        ]
+    )
+    outputs = [future.result() for future in futures]
+
+    assert [output.output for output in outputs] == [1, 2, 3]
+    assert all(isinstance(output, FunctionOutput) for output in outputs)
+
+
+def test_function_tool_execute():
+    sync_tool = FunctionTool(fn=sync_add)
+    async_tool = FunctionTool(fn=async_add)
+
+    # outside of an event loop both return the FunctionOutput directly
+    assert sync_tool.execute(1, 2).output == 3
+    assert async_tool.execute(1, 2).output == 3
+
+    async def run_in_loop():
+        return await asyncio.gather(sync_tool.execute(3, 4), async_tool.execute(5, 6))
+
+    outputs = asyncio.run(run_in_loop())
+    assert [output.output for output in outputs] == [7, 11]
+
+
+def test_function_tool_definition_serialization_cached():
+    tool = FunctionTool(fn=sync_add)
+    assert tool.definition_json == tool.definition.to_json()
+    assert tool.definition_yaml == tool.definition.to_yaml()
+    assert tool.definition_json is tool.definition_json
+
+    tool.definition = FunctionDefinition(func_name="renamed", func_desc="renamed")
+    assert "renamed" in tool.definition_json
+    assert ToolManager(tools=[tool]).json_definitions == [tool.definition.to_json()]
+
+
+def test_function_tool_output_name_follows_definition():
+    tool = FunctionTool(fn=sync_add)
+    assert tool.call(1, 2).name == "sync_add"
+
+    tool.definition = FunctionDefinition(func_name="renamed", func_desc="renamed")
+    output = tool.call(1, 2)
+    assert output.name == "renamed"
+    assert output.input.name == "renamed"
+
+
+def numeric_sum(n: int) -> int:
+    """Sum of the first n integers."""
+    total = 0
+    for i in range(n):
+        total += i
+    return total
+
+
+def count_items(items: dict) -> int:
+    """Number of items."""
+    return len(items)
+
+
+def test_function_tool_numba():
+    pytest.importorskip("numba")
+    tool = FunctionTool(fn=numeric_sum, numba=True)
+
+    # the definition is still built from the python function
+    assert tool.definition.func_name == "numeric_sum"
+    assert "n" in tool.definition.func_parameters["properties"]
+
+    tool.warmup(10)
+    assert tool.call(100).output == sum(range(100))
+
+    # arguments numba cannot type fall back to the python function
+    count_tool = FunctionTool(fn=count_items, numba=True)
+    assert count_tool.call({"a": 1, "b": 2}).output == 2
+
+    with pytest.raises(ValueError):
+        FunctionTool(fn=async_add, numba=True)
+
+
+def test_function_tool_warmup_without_numba():
+    calls = []
+
+    def record(x):
+        calls.append(x)
+        return x
+
+    FunctionTool(fn=record).warmup(1)
+    assert calls == []
+
+    async_tool = FunctionTool(fn=async_add)
+    with warnings.catch_warnings():
+        # an unawaited coroutine would be reported as a RuntimeWarning
+        warnings.simplefilter("error", RuntimeWarning)
+        async_tool.warmup(1, 2)
+
+
+def test_function_tool_numba_fallbacks():
+    pytest.importorskip("numba")
+
+    # no source file (notebook, REPL, exec): numba cannot cache it, compiles without the cache
+    namespace = {}
+    exec(inspect.getsource(numeric_sum), namespace)
+    tool = FunctionTool(fn=namespace["numeric_sum"], numba=True)
+    assert tool.call(100).output == sum(range(100))
+
+    # numba errors other than typing errors also fall back to python
+    def define_class(n: int) -> int:
+        class Local:
+            pass
+
+        return n
+
+    assert FunctionTool(fn=define_class, numba=True).call(5).output == 5
+
+
+def test_function_tool_async_call_inside_non_patchable_loop():
+    uvloop = pytest.importorskip("uvloop")
+    tool = FunctionTool(fn=async_add)
+
+    async def call_sync_from_loop():
+        # nest_asyncio cannot patch uvloop, the call runs on the background loop instead
+        return tool.call(1, 2).output
+
+    loop = uvloop.new_event_loop()
+    try:
+        assert loop.run_until_complete(call_sync_from_loop()) == 3
+    finally:
+        loop.close()
+
+
+# uvloop and nest_asyncio patch process-wide state, so each ordering runs in a fresh interpreter
+_UVLOOP_SCRIPT = """
+import asyncio
+from adalflow.core.func_tool import install_uvloop
+from adalflow.core.tool_manager import ToolManager
+from adalflow.core.types import Function
+
+async def async_add(x, y):
+    return x + y
+
+async def call_sync_in_loop():
+    return manager.tools[0].call(1, 2).output
+
+{setup}
+
+async def main():
+    is_uvloop = type(asyncio.get_running_loop()).__module__.startswith("uvloop")
+    output = await manager.execute_func_async(Function(name="async_add", args=[1, 2]))
+    # sync call of an async tool from inside the running loop
+    sync_output = manager.tools[0].call(3, 4).output
+    return is_uvloop, output.output, sync_output
+
+print(installed, *asyncio.run(main()))
+"""
+
+
+@pytest.mark.parametrize(
+    "setup, expected",
+    [
+        (
+            "installed = install_uvloop()\nmanager = ToolManager(tools=[async_add])",
+            "True True 3 7",
+        ),
+        (
+            "manager = ToolManager(tools=[async_add])\ninstalled = install_uvloop()",
+            "True True 3 7",
+        ),
+        (
+            # a sync call of an async tool inside a running loop applies nest_asyncio
+            "manager = ToolManager(tools=[async_add])\n"
+            "asyncio.run(call_sync_in_loop())\n"
+            "installed = install_uvloop()",
+            "False False 3 7",
+        ),
+    ],
+    ids=["uvloop_first", "tool_manager_first", "nest_asyncio_first"],
+)
+def test_tool_manager_with_uvloop(setup, expected):
+    pytest.importorskip("uvloop")
+    assert _run_in_fresh_interpreter(_UVLOOP_SCRIPT.format(setup=setup)) == expected
+
+
+def test_function_tool_nested_sync_call_under_uvloop():
+    pytest.importorskip("uvloop")
+    script = """
+from adalflow.core.func_tool import FunctionTool, install_uvloop
+
+install_uvloop()
+
+async def inner(x):
+    return x
+
+inner_tool = FunctionTool(fn=inner)
+
+async def outer(x):
+    # runs on the background uvloop loop, which nest_asyncio cannot re-enter
+    return inner_tool.call(x).output
+
+print(FunctionTool(fn=outer).call(1).output)
+"""
+    # a deadlock shows up as subprocess.TimeoutExpired
+    assert _run_in_fresh_interpreter(script, timeout=30) == "1"
+
+
+def _run_in_fresh_interpreter(script: str, timeout: int = 60) -> str:
+    import os
+    import subprocess
+    import sys
+
+    import adalflow
+
+    package_root = os.path.dirname(os.path.dirname(adalflow.__file__))
+    env = {**os.environ, "PYTHONPATH": package_root, "ADALFLOW_USE_UVLOOP": ""}
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
 # =============== MERGED TESTS FROM dev_function_tool.py ===============
 
 
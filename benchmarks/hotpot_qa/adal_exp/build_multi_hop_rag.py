@@ -1,7 +1,8 @@
 """We will use dspy's retriever to keep that the same and only use our generator and optimizer"""
 
+import logging
 import dspy
-from typing import List, Optional
+from typing import List, Optional, Union
 from dataclasses import dataclass, field
 
 import adalflow as adal
@@ -11,7 +12,6 @@ from adalflow.optim.parameter import Parameter, ParameterType
 from adalflow.core.retriever import Retriever
 
 from benchmarks.hotpot_qa.adal_exp.build_vanilla_rag import DspyRetriever
-from adalflow.utils.logger import printc
 from adalflow.components.agent.react import ReActAgent
 
 from adalflow.optim.grad_component import GradComponent
@@ -24,6 +24,8 @@ colbertv2_wiki17_abstracts = dspy.ColBERTv2(
 
 dspy.settings.configure(rm=colbertv2_wiki17_abstracts)
 
+log = logging.getLogger(__name__)
+
 
 # task pipeline
 
@@ -404,6 +406,18 @@ Context from last search query: {{context}}\
     def context_to_str(context: List[str]) -> str:
         return "\n".join(context)
 
+    @staticmethod
+    def question_to_param(question: Union[str, Parameter]) -> Parameter:
+        if isinstance(question, Parameter):
+            return question
+        return adal.Parameter(
+            name="question",
+            data=question,
+            role_desc="The question to be answered",
+            requires_opt=False,
+            param_type=ParameterType.INPUT,
+        )
+
     @staticmethod
     def deduplicate(seq: list[str]) -> list[str]:
         """
@@ -440,26 +454,51 @@ Context from last search query: {{context}}\
         )
         return out
 
-    def forward(self, *, input: str, id: str = None) -> adal.Parameter:
+    async def acall(self, *, input: str, id: str = None) -> adal.RetrieverOutput:
+        context = []
+        queries: List[str] = []
+        last_query = None
+        for i in range(self.max_hops):
+            gen_out = await self.query_generators[i].acall(
+                prompt_kwargs={
+                    "context": context,
+                    "question": input,
+                    "last_query": last_query,
+                },
+                id=id,
+            )
+
+            query = gen_out.data.query if gen_out.data and gen_out.data.query else input
+
+            retrieve_out = await self.retrievers[i].acall(input=query, id=id)
+
+            passages = retrieve_out.documents
+            context = self.deduplicate(context + passages)
+            queries.append(query)
+            last_query = query
+        out = adal.RetrieverOutput(
+            documents=context, query=queries, doc_indices=[], id=id
+        )
+        return out
+
+    def forward(
+        self, *, input: Union[str, Parameter], id: str = None
+    ) -> adal.Parameter:
 
         queries: List[str] = []
 
         context = []
         last_query = None
         contexts: List[Parameter] = []
+        # one input leaf shared by every hop's generator
+        question_param = self.question_to_param(input)
 
         for i in range(self.max_hops):
             gen_out: Parameter = self.query_generators[i].forward(
                 prompt_kwargs={
                     "context": context,
                     "last_query": last_query,
-                    "question": adal.Parameter(
-                        name="question",
-                        data=input,
-                        role_desc="The question to be answered",
-                        requires_opt=False,
-                        param_type=ParameterType.INPUT,
-                    ),
+                    "question": question_param,
                 },
                 id=id,
             )
@@ -514,29 +553,27 @@ Context from last search query: {{context}}\
         return contexts_sum
 
     # TODO: might need to support multiple output parameters
-    def forward2(self, *, input: str, id: str = None) -> List[adal.Parameter]:
+    def forward2(
+        self, *, input: Union[str, Parameter], id: str = None
+    ) -> List[adal.Parameter]:
         r"""Experiment multiple output parameters for multiple evaluation."""
         # assemble the foundamental building blocks
-        printc(f"question: {input}", "yellow")
+        log.debug("question: %s", input)
 
         queries: List[adal.Parameter] = []
 
         context = []
         last_query = None
         contexts: List[Parameter] = []
+        # one input leaf shared by every hop's generator
+        question_param = self.question_to_param(input)
 
         for i in range(self.max_hops):
             gen_out: Parameter = self.query_generators[i].forward(
                 prompt_kwargs={
                     "context": context,
                     "last_query": last_query,
-                    "question": adal.Parameter(
-                        name="question",
-                        data=input,
-                        role_desc="The question to be answered",
-                        requires_opt=False,
-                        param_type=ParameterType.INPUT,
-                    ),
+                    "question": question_param,
                 },
                 id=id,
             )
@@ -592,7 +629,7 @@ Context from last search query: {{context}}\
             successor=self.combine_queries, map_fn=lambda x: x.data.data.query
         )
         combined_queries = self.combine_queries.forward(q_1=queries[0], q_2=queries[1])
-        printc(f"queries: {combined_queries.data}", "yellow")
+        log.debug("queries: %s", combined_queries.data)
         return combined_queries
 
 
@@ -1,5 +1,6 @@
 """We will use dspy's retriever to keep that the same and only use our generator and optimizer"""
 
+import asyncio
 from typing import List, Optional, Union
 from dataclasses import dataclass, field
 import dspy
@@ -117,6 +118,12 @@ class DspyRetriever(Retriever):
             doc_indices=[],
         )
 
+    async def acall(
+        self, input: str, top_k: Optional[int] = None, id: str = None
+    ) -> RetrieverOutput:
+        # the ColBERTv2 client is blocking http, run it off the event loop
+        return await asyncio.to_thread(self.call, input, top_k, id)
+
 
 task_desc_str = r"""Answer questions with short factoid answers.
 
@@ -1,3 +1,4 @@
+import logging
 from typing import Any, Callable, Dict, Tuple, List
 
 import adalflow as adal
@@ -10,20 +11,25 @@ from benchmarks.hotpot_qa.adal_exp.build_multi_hop_rag import (
     MultiHopRetriever,
 )
 from use_cases.config import gpt_3_model, gpt_4o_model
-from adalflow.utils import printc
+
+log = logging.getLogger(__name__)
+
+
+# stateless evaluators, shared by every eval_fn call
+retriever_evaluator = RetrieverEvaluator()
+query_f1_evaluator = AnswerMatchAcc(type="f1_score")
 
 
 def retriever_recall(y: List[str], y_gt: List[str]) -> float:
-    return RetrieverEvaluator().compute_single_item(y, y_gt)["recall"]
+    return retriever_evaluator.compute_single_item(y, y_gt)["recall"]
 
 
 def retriever_precision(y: List[str], y_gt: List[str]) -> float:
-    return RetrieverEvaluator().compute_single_item(y, y_gt)["precision"]
+    return retriever_evaluator.compute_single_item(y, y_gt)["precision"]
 
 
 def retriever_query_f1(y: str, y_gt: str) -> float:
-    evaluator = AnswerMatchAcc(type="f1_score")
-    score = evaluator.compute_single_item(y, y_gt)
+    score = query_f1_evaluator.compute_single_item(y, y_gt)
 
     return score
 
@@ -144,7 +150,7 @@ class MultiHopRetriever2Adal(adal.AdalComponent):
         #     title, content = doc.split("|")
         #     y_pred_titles.append(title)
 
-        printc(f"y_gt: {y_gt}, pred: {y_pred}")
+        log.debug("y_gt: %s, pred: %s", y_gt, y_pred)
 
         return self.eval_fn, {
             "y": y_pred.data,
@@ -162,7 +168,7 @@ class MultiHopRetriever2Adal(adal.AdalComponent):
 
         pred.eval_input = pred.data.data
 
-        printc(f"y_gt 1: {sample.gold_titles}, pred 1: {pred.eval_input}")
+        log.debug("y_gt 1: %s, pred 1: %s", sample.gold_titles, pred.eval_input)
 
         return self.loss_fn, {
             "kwargs": {"y": pred, "y_gt": y_gt},
@@ -1,3 +1,4 @@
+import logging
 from typing import Any, Callable, Dict, Tuple
 
 import adalflow as adal
@@ -8,7 +9,7 @@ from benchmarks.hotpot_qa.config import load_datasets
 from benchmarks.hotpot_qa.adal_exp.build_vanilla_rag import Vanilla
 from use_cases.config import gpt_3_model, gpt_4o_model, gpt_3_1106_model
 
-from adalflow.utils import printc
+log = logging.getLogger(__name__)
 
 
 # TODO: look more into the loss function
@@ -63,7 +64,7 @@ class VallinaAdal(adal.AdalComponent):
         y_label = ""
         if y_pred and y_pred.data and y_pred.data.answer:
             y_label = y_pred.data.answer  # .lower()
-        printc(f"y_label: {y_label}, y_gt: {sample.answer}")
+        log.debug("y_label: %s, y_gt: %s", y_label, sample.answer)
         return self.eval_fn, {"y": y_label, "y_gt": sample.answer}
 
     def prepare_loss_eval(self, sample: Any, y_pred: Any, *args, **kwargs) -> float:
@@ -1,9 +1,13 @@
 dspy_save_path = "benchmarks/BHH_object_count/models/dspy"
 adal_save_path = "benchmarks/BHH_object_count/models/adal"
 
+from functools import lru_cache
+
 from adalflow.datasets.hotpot_qa import HotPotQA
 
 
+# diagnose/train helpers each call this; parse the split files once per process
+@lru_cache(maxsize=1)
 def load_datasets():
 
     trainset = HotPotQA(split="train", size=100)  # 20